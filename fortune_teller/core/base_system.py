@@ -9,6 +9,10 @@ from typing import Dict, Any
 class BaseFortuneSystem(ABC):
     """Base abstract class for all fortune telling systems."""
     
+    # Subclasses may declare __slots__ = () to drop the per-instance __dict__;
+    # __weakref__ keeps instances weak-referenceable either way
+    __slots__ = ("name", "display_name", "description", "__weakref__")
+    
     def __init__(self, name: str, display_name: str, description: str = ""):
         """
         Initialize the fortune system.
@@ -3,16 +3,21 @@ Configuration manager for fortune telling systems.
 Handles loading, saving, and accessing configuration.
 """
 import os
+import copy
 import json
 import yaml
 import logging
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, 
                     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger("ConfigManager")
 
+# 已解析的配置文件缓存：路径 -> (mtime_ns, 文件大小, 配置)
+# 文件未改动时复用解析结果，避免重复解析 YAML
+_PARSED_CONFIG_CACHE: Dict[str, Tuple[int, int, Dict[str, Any]]] = {}
+
 
 class ConfigManager:
     """
@@ -73,6 +78,13 @@ class ConfigManager:
         try:
             # Check if config file exists
             if os.path.isfile(self.config_file):
+                # Reuse the parsed config if the file has not changed
+                stat = os.stat(self.config_file)
+                cached = _PARSED_CONFIG_CACHE.get(self.config_file)
+                if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+                    logger.info(f"Configuration loaded from cache for {self.config_file}")
+                    return copy.deepcopy(cached[2])
+                
                 # Determine file format based on extension
                 if self.config_file.endswith((".yaml", ".yml")):
                     with open(self.config_file, "r", encoding="utf-8") as f:
@@ -85,7 +97,10 @@ class ConfigManager:
                     config = self._get_default_config()
                 
                 logger.info(f"Configuration loaded from {self.config_file}")
-                return config or self._get_default_config()
+                if config:
+                    _PARSED_CONFIG_CACHE[self.config_file] = (stat.st_mtime_ns, stat.st_size, config)
+                    return copy.deepcopy(config)
+                return self._get_default_config()
             else:
                 logger.warning(f"No configuration file found at {self.config_file}, creating default configuration")
                 config = self._get_default_config()
@@ -140,17 +155,27 @@ class ConfigManager:
             # Ensure directory exists
             os.makedirs(os.path.dirname(self.config_file), exist_ok=True)
             
-            # Save according to file format
+            # Serialize according to file format
             if self.config_file.endswith((".yaml", ".yml")):
-                with open(self.config_file, "w", encoding="utf-8") as f:
-                    yaml.dump(self.config, f, default_flow_style=False)
+                data = yaml.dump(self.config, default_flow_style=False)
             elif self.config_file.endswith(".json"):
-                with open(self.config_file, "w", encoding="utf-8") as f:
-                    json.dump(self.config, f, indent=4)
+                data = json.dumps(self.config, indent=4)
             else:
                 logger.warning(f"Unsupported config file format: {self.config_file}")
                 return False
             
+            # Write to a temporary file and swap it in atomically so a crash
+            # mid-write never leaves a truncated config behind
+            tmp_file = f"{self.config_file}.{os.getpid()}.tmp"
+            try:
+                with open(tmp_file, "w", encoding="utf-8") as f:
+                    f.write(data)
+                os.replace(tmp_file, self.config_file)
+            except OSError:
+                if os.path.exists(tmp_file):
+                    os.remove(tmp_file)
+                raise
+            
             logger.info(f"Configuration saved to {self.config_file}")
             return True
         
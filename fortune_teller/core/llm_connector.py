@@ -8,6 +8,7 @@ import logging
 import time
 import re
 import random
+from collections import OrderedDict
 from typing import Dict, Any, Optional, List, Tuple, Callable, Generator, Iterator
 
 from .mock_connector import MockConnector
@@ -38,8 +39,9 @@ class LLMConnector:
         self.temperature = self.config.get("temperature", 0.7)
         self.max_tokens = self.config.get("max_tokens", 2000)
 
-        # Cache for responses
-        self.cache = {}
+        # Cache for responses (LRU, bounded by cache_size)
+        self.cache_size = self.config.get("cache_size", 128)
+        self.cache = OrderedDict()
 
         # Initialize the appropriate client based on the provider
         self._initialize_client()
@@ -137,6 +139,7 @@ class LLMConnector:
         # Check cache if enabled
         if use_cache and cache_key in self.cache:
             logger.info("Using cached response")
+            self.cache.move_to_end(cache_key)
             return self.cache[cache_key]
 
         try:
@@ -173,6 +176,9 @@ class LLMConnector:
             # Cache the response
             if use_cache:
                 self.cache[cache_key] = response
+                self.cache.move_to_end(cache_key)
+                if len(self.cache) > self.cache_size:
+                    self.cache.popitem(last=False)
 
             return response
 
@@ -180,10 +186,10 @@ class LLMConnector:
             logger.error(f"Error generating LLM response: {e}")
             return f"Error: {str(e)}", {"error": str(e)}
 
-    def _generate_cache_key(self, system_prompt: str, user_prompt: str) -> str:
+    def _generate_cache_key(self, system_prompt: str, user_prompt: str) -> Tuple[str, str, str, str]:
         """Generate a cache key for the given prompts."""
-        combined = f"{self.provider}_{self.model}_{system_prompt}_{user_prompt}"
-        return str(hash(combined))
+        # 直接用元组作键：无需拼接长提示词，且不会因哈希碰撞返回错误的缓存
+        return (self.provider, self.model, system_prompt, user_prompt)
 
 
     def _call_openai(self, system_prompt: str, user_prompt: str) -> Tuple[str, Dict[str, Any]]:
@@ -295,7 +301,7 @@ class LLMConnector:
             self.api_key = os.environ.get(f"{provider.upper()}_API_KEY")
 
         # Clear cache when changing provider
-        self.cache = {}
+        self.cache.clear()
 
         # Re-initialize client
         self._initialize_client()
@@ -314,7 +320,7 @@ class LLMConnector:
         logger.info(f"Model changed to {model}")
 
         # Clear cache when changing model
-        self.cache = {}
+        self.cache.clear()
         
     def generate_response_streaming(self, 
                                    system_prompt: str, 
@@ -15,12 +15,15 @@ class TranslationManager:
     
     def __init__(self):
         self.translations: Dict[str, Dict[str, str]] = {}
+        # 每种语言预先合并英文回退后的目录，查找只需一次字典访问
+        self._catalogs: Dict[str, Dict[str, str]] = {}
         self.locales_dir = os.path.join(os.path.dirname(__file__), "locales")
         self.load_translations()
     
     def load_translations(self):
         """Load all translation files from locales directory"""
         self.translations = {}
+        self._catalogs = {}
         
         if not os.path.exists(self.locales_dir):
             logger.warning(f"Locales directory not found: {self.locales_dir}")
@@ -37,6 +40,12 @@ class TranslationManager:
                     logger.debug(f"Loaded translations for {lang_code}")
                 except Exception as e:
                     logger.error(f"Failed to load {filename}: {e}")
+        
+        # Merge the English fallback into every language once, up front
+        fallback = self.translations.get("en", {})
+        self._catalogs = {
+            lang: {**fallback, **texts} for lang, texts in self.translations.items()
+        }
     
     def get(self, key: str, lang: str = "zh") -> str:
         """
@@ -49,13 +58,14 @@ class TranslationManager:
         Returns:
             Translated text or fallback
         """
-        # Try requested language
-        if lang in self.translations and key in self.translations[lang]:
-            return self.translations[lang][key]
+        # Requested language (already merged with the English fallback)
+        catalog = self._catalogs.get(lang)
+        if catalog is None:
+            catalog = self._catalogs.get("en", {})
         
-        # Fallback to English
-        if lang != "en" and "en" in self.translations and key in self.translations["en"]:
-            return self.translations["en"][key]
+        text = catalog.get(key)
+        if text is not None:
+            return text
         
         # Final fallback to key itself
         logger.warning(f"Translation missing: {key} for {lang}")
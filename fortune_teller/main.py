@@ -12,6 +12,8 @@ import json
 import traceback
 import time
 import datetime
+import functools
+import collections
 from typing import Dict, Any, List, Optional
 
 # 静默所有第三方库的日志，将它们仅输出到文件
@@ -47,11 +49,42 @@ from fortune_teller.ui.display import (
     print_followup_result_streaming
 )
 from fortune_teller.ui.animation import LoadingAnimation
+from fortune_teller.ui.thinking_animation import ChatThinkingAnimation
+from fortune_teller.i18n import t
+
+# orjson is an optional speedup; fall back to the standard json module
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # 应用专用的日志配置
 logger = logging.getLogger("FortuneTeller")
 
 
+def _dumps_reading(reading: Dict[str, Any]) -> bytes:
+    """Serialize a reading as indented, non-ASCII-escaped UTF-8 JSON."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(reading, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            # 含 orjson 不支持的类型时交给标准库处理（报错行为保持不变）
+            pass
+    return json.dumps(reading, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+@functools.lru_cache(maxsize=32)
+def _localize_system_prompt(system_prompt: str, language: str) -> str:
+    """
+    Append the language directive to a system prompt.
+
+    Memoized per (prompt, language): system prompts are static per fortune
+    system, so chat turns reuse the same composed prompt instead of
+    rebuilding it (and re-resolving the directive) on every message.
+    """
+    return f"{system_prompt}\n\n{t('llm_language_directive', language)}"
+
+
 class FortuneTeller:
     """Main Fortune Teller application class."""
 
@@ -91,8 +124,7 @@ class FortuneTeller:
 
     def _localized_system_prompt(self, system_prompt: str) -> str:
         """Append the language directive so the LLM replies in the user's language."""
-        from .i18n import t
-        return f"{system_prompt}\n\n{t('llm_language_directive', self.language)}"
+        return _localize_system_prompt(system_prompt, self.language)
     
     def get_available_systems(self) -> List[Dict[str, Any]]:
         """
@@ -241,7 +273,7 @@ class FortuneTeller:
             clean_topic = topic[2:].strip()  # Remove emoji and whitespace
             
         if topic not in valid_topics:
-            topics_str = "、".join(list(valid_topics.keys()))
+            topics_str = "、".join(valid_topics)
             raise ValueError(f"请选择有效的解读主题: {topics_str}")
             
         try:
@@ -398,8 +430,17 @@ class FortuneTeller:
         os.makedirs(os.path.dirname(os.path.abspath(filename)), exist_ok=True)
         
         # Save the reading
-        with open(filename, "w", encoding="utf-8") as f:
-            json.dump(reading, f, ensure_ascii=False, indent=2)
+        data = _dumps_reading(reading)
+        tmp_filename = f"{filename}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_filename, "wb") as f:
+                f.write(data)
+            # 原子替换，写入中断时不会留下截断的文件
+            os.replace(tmp_filename, filename)
+        except OSError:
+            if os.path.exists(tmp_filename):
+                os.remove(tmp_filename)
+            raise
         
         return os.path.abspath(filename)
 
@@ -412,7 +453,6 @@ def run_interactive_menu(fortune_teller, args):
         fortune_teller: FortuneTeller instance
         args: Parsed command-line arguments
     """
-    from .i18n import t
     lang = fortune_teller.language
 
     try:
@@ -627,10 +667,12 @@ def run_chat_mode(fortune_teller, system_name=None):
         animation = LoadingAnimation("霄占命理师正在沉思")
         animation.start()
         
+        # Resolve the session's prompt and connector once; they stay fixed for the whole chat
+        localized_system_prompt = fortune_teller._localized_system_prompt(system_prompt)
+        llm_connector = fortune_teller.llm_connector
+        
         # Get initial greeting from LLM
-        response, _ = fortune_teller.llm_connector.generate_response(
-            fortune_teller._localized_system_prompt(system_prompt), user_prompt
-        )
+        response, _ = llm_connector.generate_response(localized_system_prompt, user_prompt)
         
         # Stop animation
         animation.stop()
@@ -639,10 +681,11 @@ def run_chat_mode(fortune_teller, system_name=None):
         print(f"\n{Colors.GREEN}霄占: {Colors.ENDC}{response.strip()}\n")
         
         # Chat loop
-        chat_context = []  # Store recent chat history
+        chat_context = collections.deque(maxlen=5)  # Store recent chat history (last 5 entries)
+        input_prompt = f"{Colors.YELLOW}您: {Colors.ENDC}"
         while True:
             # Get user input
-            user_input = input(f"{Colors.YELLOW}您: {Colors.ENDC}")
+            user_input = input(input_prompt)
             
             # Check for exit command
             if user_input.lower().strip() in ["exit", "quit", "退出", "q"]:
@@ -652,13 +695,9 @@ def run_chat_mode(fortune_teller, system_name=None):
             if not user_input.strip():
                 continue
             
-            # Add to chat context
+            # Add to chat context (the deque drops the oldest entries itself)
             chat_context.append(f"用户: {user_input}")
             
-            # Limit context length
-            if len(chat_context) > 5:
-                chat_context = chat_context[-5:]
-            
             # Create prompt with context
             context_prompt = "\n".join(chat_context)
             chat_prompt = f"""求测者刚刚说: "{user_input}"
@@ -678,7 +717,7 @@ def run_chat_mode(fortune_teller, system_name=None):
                     animation.stop()
                     
                     # 显示流式结果并测量首个块延迟
-                    complete_response = ""
+                    response_parts = []
                     chunk_count = 0
                     first_chunk_time = None
                     
@@ -703,14 +742,14 @@ def run_chat_mode(fortune_teller, system_name=None):
                         sys.stdout.flush()
                         
                         # 添加到完整响应
-                        complete_response += chunk
+                        response_parts.append(chunk)
                         
                         # 适当延迟以确保更流畅的阅读体验
                         time.sleep(0.05)  # 从0.01增加到0.05，使输出更平滑
                     
                     # 流式响应后添加换行
                     print("\n")
-                    return complete_response
+                    return "".join(response_parts)
                 
                 def handle_chat_standard(response, metadata, thinking_anim):
                     """聊天标准输出处理函数"""
@@ -723,9 +762,6 @@ def run_chat_mode(fortune_teller, system_name=None):
                     print(f"{response.strip()}\n")
                     return response
                 
-                # 在调用前导入并初始化思考动画
-                from fortune_teller.ui.thinking_animation import ChatThinkingAnimation
-                
                 # 先完全停止主动画，确保它不再显示任何内容
                 animation.stop()
                 
@@ -742,8 +778,8 @@ def run_chat_mode(fortune_teller, system_name=None):
                 thinking_animation.start()
                 
                 # 使用统一的API生成响应
-                response = fortune_teller.llm_connector.generate_best_response(
-                    fortune_teller._localized_system_prompt(system_prompt),
+                response = llm_connector.generate_best_response(
+                    localized_system_prompt,
                     chat_prompt,
                     streaming_handler=lambda gen, st: handle_chat_streaming(gen, st, thinking_animation),
                     non_streaming_handler=lambda resp, meta: handle_chat_standard(resp, meta, thinking_animation)
@@ -1008,9 +1044,6 @@ def run_followup_menu(fortune_teller):
                         print_followup_result(selected_topic, response)
                         return response
                     
-                    # Import and setup thinking animation
-                    from fortune_teller.ui.thinking_animation import ChatThinkingAnimation
-                    
                     # 先完全停止主动画，确保它不再显示任何内容
                     animation.stop()
                     
@@ -1072,7 +1105,6 @@ def main():
         logging.getLogger().addHandler(console_handler)
 
     # Resolve language: --lang > interactive picker (TTY) > zh default
-    from .i18n import t
     language = args.lang
     if language is None and not args.list and sys.stdin.isatty():
         from .ui.keyboard_input import select_language
@@ -5,8 +5,9 @@ Provides access to the fortune telling plugins.
 import os
 import importlib
 import logging
-from typing import Dict, List, Any, Type
+from typing import List, Any, Mapping, Type
 from pathlib import Path
+from types import MappingProxyType
 
 from fortune_teller.core import BaseFortuneSystem
 
@@ -16,6 +17,9 @@ logger = logging.getLogger("Plugins")
 # Dictionary to store plugin references
 plugin_registry = {}
 
+# Read-only view of the registry, handed out instead of copies
+_plugin_registry_view = MappingProxyType(plugin_registry)
+
 def register_plugin(name: str, plugin_class: Type[BaseFortuneSystem]) -> None:
     """
     Register a plugin with the plugin registry.
@@ -48,11 +52,11 @@ def get_plugin_class(name: str) -> Type[BaseFortuneSystem]:
     
     return plugin_registry[name]
 
-def get_all_plugins() -> Dict[str, Type[BaseFortuneSystem]]:
+def get_all_plugins() -> Mapping[str, Type[BaseFortuneSystem]]:
     """
     Get all registered plugins.
     
     Returns:
-        Dictionary mapping plugin names to plugin classes
+        Read-only mapping of plugin names to plugin classes
     """
-    return plugin_registry.copy()
+    return _plugin_registry_view
@@ -10,6 +10,72 @@ from fortune_teller.core import BaseFortuneSystem
 # Configure logging
 logger = logging.getLogger("BaziFortuneSystem")
 
+# 解读用系统提示词（静态内容，只构建一次）
+_READING_SYSTEM_PROMPT = """你是"霄占"命理大师，一位来自中国的八字命理学专家，已有30年的占卜经验，性格风趣幽默又不失智慧。
+你的特点是：用生动有趣的语言解读命理，偶尔引用网络流行语和古代诗词，让严肃的命理学充满趣味性。
+你对每位求测者都充满好奇和热情，像对老朋友一样亲切自然，经常使用"哎呀""啧啧""哈哈"等口头禅。
+
+请基于以下八字信息，**首先只提供**：
+
+亲切地问候求测者，可以根据他们的八字或出生日期开个小玩笑
+1. 八字总评：以诙谐的方式点评命局整体特点，用生动比喻说明此八字的基本特质
+2. 五行简述：简单介绍五行强弱，但要用有趣的比喻
+
+**不要**在初始回答中提供以下内容（这些将是用户可以进一步了解的内容）：
+- 详细的性格分析
+- 事业财运建议
+- 感情婚姻解读
+- 健康状况提示
+- 大运流年预测
+
+在回答结束时，告诉用户他们可以向你询问更多关于"性格特点"、"事业财运"、"感情姻缘"、"健康提示"或"大运流年"的详细解读。
+
+请确保你的回答既专业又风趣，像一位和蔼可亲的长辈聊天，而不是冷冰冰的说教。让求测者感到轻松愉快，同时获得有价值的人生启示。
+
+记住：命理分析不是决定论，而是提供一种可能性的参考。用你的智慧和幽默感，让古老的命理学焕发新的魅力！
+"""
+
+# 用户提示词模板：按 format_map 填入排盘结果
+_USER_PROMPT_HEADER = """请分析以下八字：
+
+基本信息：
+- 性别：{gender}
+- 出生日期：{birth_date}
+- 出生时间：{birth_time}
+- 出生地点：{location}
+
+四柱八字：
+{year} {month} {day} {hour}
+
+"""
+
+_PILLAR_LINE = "{label}：{stem}{branch} ({stem_element}、{branch_element})"
+
+_UNKNOWN_HOUR_LINE = "时柱：未知"
+
+_ELEMENTS_TEMPLATE = """
+
+五行统计：
+木：{木}
+火：{火}
+土：{土}
+金：{金}
+水：{水}
+
+最强五行：{strongest}
+最弱五行：{weakest}
+
+日主：{character} ({element})
+
+五行关系："""
+
+_RELATIONSHIP_LINE = """
+- {day_element}与{element}：{relationship}"""
+
+_USER_PROMPT_FOOTER = """
+
+请根据以上信息，给出详细的八字命理分析与人生建议。"""
+
 
 class BaziFortuneSystem(BaseFortuneSystem):
     """
@@ -172,6 +238,9 @@ class BaziFortuneSystem(BaseFortuneSystem):
     HEAVENLY_STEMS = ["甲", "乙", "丙", "丁", "戊", "己", "庚", "辛", "壬", "癸"]
     EARTHLY_BRANCHES = ["子", "丑", "寅", "卯", "辰", "巳", "午", "未", "申", "酉", "戌", "亥"]
     
+    # 天干 -> 序号，替代 list.index 的线性查找
+    _STEM_INDEX = {stem: index for index, stem in enumerate(HEAVENLY_STEMS)}
+    
     # Element emojis
     ELEMENT_EMOJIS = {
         "木": "🌳",
@@ -445,85 +514,42 @@ class BaziFortuneSystem(BaseFortuneSystem):
         Returns:
             Dictionary containing system_prompt and user_prompt for the LLM
         """
-        # Create the system prompt with a more engaging, friendly persona
-        system_prompt = f"""你是"霄占"命理大师，一位来自中国的八字命理学专家，已有30年的占卜经验，性格风趣幽默又不失智慧。
-你的特点是：用生动有趣的语言解读命理，偶尔引用网络流行语和古代诗词，让严肃的命理学充满趣味性。
-你对每位求测者都充满好奇和热情，像对老朋友一样亲切自然，经常使用"哎呀""啧啧""哈哈"等口头禅。
-
-请基于以下八字信息，**首先只提供**：
-
-亲切地问候求测者，可以根据他们的八字或出生日期开个小玩笑
-1. 八字总评：以诙谐的方式点评命局整体特点，用生动比喻说明此八字的基本特质
-2. 五行简述：简单介绍五行强弱，但要用有趣的比喻
-
-**不要**在初始回答中提供以下内容（这些将是用户可以进一步了解的内容）：
-- 详细的性格分析
-- 事业财运建议
-- 感情婚姻解读
-- 健康状况提示
-- 大运流年预测
-
-在回答结束时，告诉用户他们可以向你询问更多关于"性格特点"、"事业财运"、"感情姻缘"、"健康提示"或"大运流年"的详细解读。
-
-请确保你的回答既专业又风趣，像一位和蔼可亲的长辈聊天，而不是冷冰冰的说教。让求测者感到轻松愉快，同时获得有价值的人生启示。
-
-记住：命理分析不是决定论，而是提供一种可能性的参考。用你的智慧和幽默感，让古老的命理学焕发新的魅力！
-"""
-        
-        # Construct four pillars string representation
-        fp = processed_data["four_pillars"]
-        four_pillars = f"{fp['year']} {fp['month']} {fp['day']} {fp['hour']}"
+        system_prompt = _READING_SYSTEM_PROMPT
         
         # Create user prompt with the analyzed data
-        user_prompt = f"""请分析以下八字：
-
-基本信息：
-- 性别：{processed_data['gender']}
-- 出生日期：{processed_data['birth_date']}
-- 出生时间：{processed_data['birth_time']}
-- 出生地点：{processed_data['location']}
-
-四柱八字：
-{four_pillars}
-
-年柱：{processed_data['year_pillar']['stem']}{processed_data['year_pillar']['branch']} ({processed_data['year_pillar']['stem_element']}、{processed_data['year_pillar']['branch_element']})
-月柱：{processed_data['month_pillar']['stem']}{processed_data['month_pillar']['branch']} ({processed_data['month_pillar']['stem_element']}、{processed_data['month_pillar']['branch_element']})
-日柱：{processed_data['day_pillar']['stem']}{processed_data['day_pillar']['branch']} ({processed_data['day_pillar']['stem_element']}、{processed_data['day_pillar']['branch_element']})"""
-        
-        if processed_data["hour_pillar"]:
-            hp = processed_data["hour_pillar"]
-            user_prompt += f"""
-时柱：{hp['stem']}{hp['branch']} ({hp['stem_element']}、{hp['branch_element']})"""
-        else:
-            user_prompt += """
-时柱：未知"""
+        hour_pillar = processed_data["hour_pillar"]
+        pillar_lines = [
+            _PILLAR_LINE.format(label=label, **processed_data[key])
+            for label, key in (("年柱", "year_pillar"), ("月柱", "month_pillar"), ("日柱", "day_pillar"))
+        ]
+        pillar_lines.append(
+            _PILLAR_LINE.format(label="时柱", **hour_pillar) if hour_pillar else _UNKNOWN_HOUR_LINE
+        )
         
-        # Add element analysis
-        ec = processed_data["elements"]["counts"]
-        user_prompt += f"""
-
-五行统计：
-木：{ec['木']}
-火：{ec['火']}
-土：{ec['土']}
-金：{ec['金']}
-水：{ec['水']}
-
-最强五行：{processed_data["elements"]["strongest"]}
-最弱五行：{processed_data["elements"]["weakest"]}
-
-日主：{processed_data["day_master"]["character"]} ({processed_data["day_master"]["element"]})
-
-五行关系："""
+        elements = processed_data["elements"]
+        day_master = processed_data["day_master"]
+        day_element = day_master["element"]
+        
+        parts = [
+            _USER_PROMPT_HEADER.format_map({**processed_data, **processed_data["four_pillars"]}),
+            "\n".join(pillar_lines),
+            _ELEMENTS_TEMPLATE.format_map({
+                **elements["counts"],
+                "strongest": elements["strongest"],
+                "weakest": elements["weakest"],
+                "character": day_master["character"],
+                "element": day_element,
+            }),
+        ]
         
         # Add relationships
-        for element, relationship in processed_data["day_master"]["relationships"].items():
-            user_prompt += f"""
-- {processed_data["day_master"]["element"]}与{element}：{relationship}"""
+        parts.extend(
+            _RELATIONSHIP_LINE.format(day_element=day_element, element=element, relationship=relationship)
+            for element, relationship in day_master["relationships"].items()
+        )
         
-        user_prompt += """
-
-请根据以上信息，给出详细的八字命理分析与人生建议。"""
+        parts.append(_USER_PROMPT_FOOTER)
+        user_prompt = "".join(parts)
         
         return {
             "system_prompt": system_prompt,
@@ -587,9 +613,8 @@ class BaziFortuneSystem(BaseFortuneSystem):
     
     def _get_month_pillar(self, year: int, month: int) -> Tuple[str, str]:
         """Calculate the Heavenly Stem and Earthly Branch for a month."""
-        # First get the year stem
-        year_stem, _ = self._get_year_pillar(year)
-        year_stem_index = self.HEAVENLY_STEMS.index(year_stem)
+        # First get the year stem (same cycle as _get_year_pillar)
+        year_stem_index = (year - 4) % 10
         
         # The month branch is straightforward
         # Branch index is (month + 1) % 12, zero-indexed
@@ -632,7 +657,7 @@ class BaziFortuneSystem(BaseFortuneSystem):
         hour_branch = self.EARTHLY_BRANCHES[branch_index]
         
         # The hour stem depends on the day stem
-        day_stem_index = self.HEAVENLY_STEMS.index(day_stem)
+        day_stem_index = self._STEM_INDEX[day_stem]
         # Each day has a base stem for the first hour
         hour_stem_base = (day_stem_index * 2) % 10
         hour_stem_index = (hour_stem_base + branch_index) % 10
@@ -2,22 +2,249 @@
 Tarot card fortune telling system implementation.
 """
 import random
+import re
 import logging
 import json
+import functools
 import os
-from typing import Dict, Any, List, Tuple
+import sys
+from pathlib import Path
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping, NamedTuple, Optional, Tuple
 
 from fortune_teller.core import BaseFortuneSystem
+from fortune_teller.ui.colors import Colors
+
+# orjson is an optional speedup; fall back to the standard json module
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Configure logging
 logger = logging.getLogger("TarotFortuneSystem")
 
 
+def _interned(*names: str) -> Tuple[str, ...]:
+    """Return the given strings as a tuple of interned strings."""
+    return tuple(sys.intern(name) for name in names)
+
+
+# 常用作字典键和比较的中文字符串在导入时驻留(intern)
+# 问题领域：元组保持显示顺序，frozenset 用于校验
+_FOCUS_OPTIONS = _interned("爱情", "事业", "健康", "财富", "灵性", "一般")
+_VALID_FOCUS = frozenset(_FOCUS_OPTIONS)
+
+
+def _json_loads(data: bytes) -> Any:
+    """Parse JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps_pretty(obj: Any) -> str:
+    """Serialize an object as indented, non-ASCII-escaped JSON for logging."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, indent=2)
+
+
+# Default card data directory, resolved once at import
+_DEFAULT_DATA_DIR = str(Path(__file__).resolve().parent.parent.parent / "data" / "tarot")
+
+# 预渲染的显示模板：颜色代码在导入时写入，显示时只填充动态部分
+_SEPARATOR = f"{Colors.CYAN}{'=' * 60}{Colors.ENDC}"
+_SEPARATOR_THIN = f"{Colors.CYAN}{'-' * 60}{Colors.ENDC}"
+_CARD_LINE_TMPL = (
+    f"{{idx}}. {Colors.YELLOW}{{pos}}{Colors.ENDC}: "
+    f"{Colors.BOLD}{{name}}{Colors.ENDC} {{emoji}} "
+    f"({{ocolor}}{{ori}} {{oemoji}}{Colors.ENDC})"
+)
+_KEYWORDS_TMPL = f"   关键词: {Colors.CYAN}{{}}{Colors.ENDC}"
+
+# 解读分段的边界行：Markdown 标题、【标题】行、以及含 ---- 的分隔线
+_SECTION_RE = re.compile(
+    r"^[^\S\n]*(?:"
+    r"(?P<hash>#.*)"
+    r"|(?P<bracket>【.*】.*)"
+    r"|(?P<rule>.*----.*)"
+    r")$",
+    re.MULTILINE,
+)
+
+# 正逆位及其抽取权重
+_UPRIGHT = sys.intern("正位")
+_REVERSED = sys.intern("逆位")
+_ORIENTATIONS = (_UPRIGHT, _REVERSED)
+_ORIENTATION_WEIGHTS = (0.67, 0.33)
+
+# 正逆位对应的颜色和emoji
+_ORI_STYLE = {
+    _UPRIGHT: (Colors.GREEN, "⬆️ "),
+    _REVERSED: (Colors.RED, "⬇️ "),
+}
+
+# 系统提示词是静态文本，定义为模块常量
+_CHAT_SYSTEM_PROMPT = """你是"霄占"塔罗牌解读大师，一位拥有深厚神秘学知识的塔罗牌专家，有着20年的塔罗牌解读经验。
+你熟知78张塔罗牌的每一种含义、象征和诠释，精通各种牌阵的解读方法。
+你的风格睿智而神秘，充满着智慧与洞察力，但同时也很亲和，能用生动的语言将复杂的符号象征转化为直观的理解。
+
+现在你正在与求测者进行轻松的聊天互动。你可以谈论:
+- 塔罗牌的历史与符号学
+- 各种牌面的含义与解读
+- 不同牌阵的特点与适用场景
+- 如何理解塔罗牌的信息
+- 塔罗牌作为自我反思工具的应用
+
+在回答中，你可以使用一些巧妙的比喻和例子，偶尔引用神话或传说，帮助求测者理解深奥的概念。
+对话应简洁精炼，回答控制在200字以内，保持优雅而富有启发性的语气。
+记住，你提供的不是固定的预言，而是帮助人们探索可能性和深入理解自我的视角。"""
+
+_READING_SYSTEM_PROMPT = """你是一位经验丰富的塔罗牌解读大师。
+请根据提供的塔罗牌阵和牌面，为咨询者提供专业、详细且有洞见的解读。
+
+非常重要：请仔细确认提示中列出的实际抽取的牌，并且只解读这些牌。
+- 你的解读必须严格基于用户提示中列出的特定牌，而不是其他任何牌。
+- 在开始解读前，请先在心里确认每个位置抽到的牌名和正逆位。
+- 确保你提到的每一张牌都是用户实际抽取的牌。
+- 不要在解读中引用或暗示任何未在用户提示中明确列出的牌。
+
+你的解读应该：
+1. 对每个牌位和对应的牌面进行解释
+2. 分析牌面之间的关系和相互影响
+3. 结合咨询者的具体问题背景进行针对性解读
+4. 提供实用的建议和可能的行动方向
+5. 保持中立、平衡的观点，不做绝对的预测
+
+你的解读应该具有启发性和支持性，帮助咨询者获得新的视角，而不是简单地告诉他们该做什么。
+请记住，塔罗牌解读提供的是可能性和潜在路径，而非确定性的未来。
+"""
+
+# 用户提示词模板：只有咨询信息和牌面是动态的
+_USER_PROMPT_HEADER = """请为以下塔罗牌阵提供详细解读：
+
+咨询信息：
+- 咨询者：{name}
+- 问题：{question}
+- 领域：{focus_area}
+
+牌阵：{spread_name} - {spread_description}
+
+抽取的牌：
+"""
+
+_CARD_PROMPT_TMPL = """
+{position}：{card} ({orientation})
+- 关键词：{keywords}
+- 描述：{description}
+"""
+
+_USER_PROMPT_FOOTER = """
+请根据以上塔罗牌阵，结合咨询者的问题"{question}"，给出详细而有洞见的解读。
+请先分别解读每个牌位的含义，然后综合分析整体牌阵所揭示的信息和建议。
+"""
+
+
+def _normalize_section_title(title: str) -> str:
+    """
+    Map a section heading from the LLM response to a standard name.
+    
+    Args:
+        title: Heading text as written by the LLM
+        
+    Returns:
+        Cleaned-up section title
+    """
+    # Clean up section titles for consistency
+    clean_title = title.replace("【", "").replace("】", "").strip()
+    
+    # For common titles, use standard names
+    if "整体" in clean_title or "综合" in clean_title:
+        return "整体解读"
+    if "各牌位" in clean_title or "牌位" in clean_title:
+        return "各牌位详细解读"
+    return clean_title
+
+
+class Card(NamedTuple):
+    """
+    A tarot card, reduced to the fields used by readings and display.
+    """
+    name: str
+    emoji: str
+    description: str
+    keywords: Tuple[str, ...]
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Card":
+        """
+        Build a card from one entry of cards.json.
+        
+        Args:
+            data: Raw card dictionary
+            
+        Returns:
+            Card instance
+        """
+        return cls(
+            name=sys.intern(data["name"]),
+            emoji=sys.intern(data.get("emoji", "")),
+            description=data["description"],
+            keywords=tuple(data["keywords"]),
+        )
+
+
 class TarotFortuneSystem(BaseFortuneSystem):
     """
     Tarot card fortune telling system.
     Based on traditional tarot card reading with various spreads.
     """
+
+    # Available spreads (read-only, shared by all instances; nested
+    # mappings and position tuples are immutable too)
+    _SPREADS = MappingProxyType({
+        "single": MappingProxyType({
+            "name": "单牌阅读",
+            "description": "抽取一张牌进行简单的阅读",
+            "positions": _interned("当前状况")
+        }),
+        "three_card": MappingProxyType({
+            "name": "三牌阵",
+            "description": "过去、现在、未来的经典三牌阵",
+            "positions": _interned("过去", "现在", "未来")
+        }),
+        "celtic_cross": MappingProxyType({
+            "name": "凯尔特十字",
+            "description": "详细分析当前情况和潜在结果的经典阵列",
+            "positions": _interned(
+                "当前状况", "挑战", "过去", "未来",
+                "意识目标", "潜意识影响", "自我认知",
+                "外部影响", "希望与恐惧", "最终结果"
+            )
+        }),
+        "relationship": MappingProxyType({
+            "name": "关系阵",
+            "description": "分析两个人之间关系的牌阵",
+            "positions": _interned(
+                "你自己", "对方", "关系基础",
+                "过去影响", "当前状态", "未来发展"
+            )
+        })
+    })
+
+    # Spreads flattened to (name, description, positions, position count)
+    # tuples for process_data
+    _SPREADS_FAST = {
+        key: (info["name"], info["description"], info["positions"], len(info["positions"]))
+        for key, info in _SPREADS.items()
+    }
+    
+    # Spreads converted to select options, built once with the class
+    _SPREAD_OPTIONS = tuple(
+        {"value": key, "label": info["name"], "description": info["description"]}
+        for key, info in _SPREADS.items()
+    )
     
     def display_processed_data(self, processed_data: Dict[str, Any]) -> None:
         """
@@ -26,8 +253,6 @@ class TarotFortuneSystem(BaseFortuneSystem):
         Args:
             processed_data: Processed tarot reading data
         """
-        from fortune_teller.ui.colors import Colors
-        
         # 获取基本信息
         question = processed_data.get("question", "未知")
         focus_area = processed_data.get("focus_area", "未知")
@@ -35,51 +260,55 @@ class TarotFortuneSystem(BaseFortuneSystem):
         spread_info = processed_data.get("spread", {})
         reading = processed_data.get("reading", [])
         
-        # 显示标题
-        print(f"\n{Colors.BOLD}{Colors.YELLOW}✨ 塔罗牌阵信息 ✨{Colors.ENDC}")
-        print(f"{Colors.CYAN}" + "=" * 60 + f"{Colors.ENDC}\n")
-        
-        # 显示基本信息
-        print(f"{Colors.BOLD}【咨询信息】{Colors.ENDC}")
-        print(f"咨询者: {name}")
-        print(f"问题: {question}")
-        print(f"领域: {focus_area}")
-        print()
-        
-        # 显示牌阵信息
-        print(f"{Colors.BOLD}【牌阵】{Colors.ENDC}")
-        print(f"名称: {spread_info.get('name', '未知')}")
-        print(f"描述: {spread_info.get('description', '未知')}")
-        print()
+        # 颜色常量绑定为局部变量
+        BOLD, YELLOW, ENDC = Colors.BOLD, Colors.YELLOW, Colors.ENDC
         
+        # 先在缓冲区中拼好整个输出，最后一次性写出
+        lines = [
+            # 显示标题
+            f"\n{BOLD}{YELLOW}✨ 塔罗牌阵信息 ✨{ENDC}",
+            _SEPARATOR + "\n",
+            
+            # 显示基本信息
+            f"{BOLD}【咨询信息】{ENDC}",
+            f"咨询者: {name}",
+            f"问题: {question}",
+            f"领域: {focus_area}",
+            "",
+            
+            # 显示牌阵信息
+            f"{BOLD}【牌阵】{ENDC}",
+            f"名称: {spread_info.get('name', '未知')}",
+            f"描述: {spread_info.get('description', '未知')}",
+            "",
+            
             # 显示抽取的牌
-        print(f"{Colors.BOLD}【抽取的牌】{Colors.ENDC}")
+            f"{BOLD}【抽取的牌】{ENDC}",
+        ]
         for i, card in enumerate(reading, 1):
             position = card.get("position", f"位置 {i}")
             card_name = card.get("card", "未知")
-            orientation = card.get("orientation", "正位")
+            orientation = card.get("orientation", _UPRIGHT)
             
             # 查找牌的emoji
-            card_emoji = ""
-            for card_data in self.cards:
-                if card_data["name"] == card_name and "emoji" in card_data:
-                    card_emoji = card_data["emoji"]
-                    break
-                    
+            card_emoji = self._emoji_by_name.get(card_name, "")
+            
             # 使用不同颜色表示正逆位
-            orientation_color = Colors.GREEN if orientation == "正位" else Colors.RED
-            orientation_emoji = "⬆️ " if orientation == "正位" else "⬇️ "
+            orientation_color, orientation_emoji = _ORI_STYLE.get(orientation, _ORI_STYLE[_REVERSED])
             
-            print(f"{i}. {Colors.YELLOW}{position}{Colors.ENDC}: "
-                  f"{Colors.BOLD}{card_name}{Colors.ENDC} {card_emoji} "
-                  f"({orientation_color}{orientation} {orientation_emoji}{Colors.ENDC})")
+            lines.append(_CARD_LINE_TMPL.format(
+                idx=i, pos=position, name=card_name, emoji=card_emoji,
+                ocolor=orientation_color, ori=orientation, oemoji=orientation_emoji,
+            ))
             
             # 显示关键词
             keywords = card.get("keywords", [])
             if keywords:
-                print(f"   关键词: {Colors.CYAN}{', '.join(keywords)}{Colors.ENDC}")
+                lines.append(_KEYWORDS_TMPL.format(', '.join(keywords)))
         
-        print(f"\n{Colors.CYAN}" + "-" * 60 + f"{Colors.ENDC}")
+        lines.append("\n" + _SEPARATOR_THIN)
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
     
     def get_chat_system_prompt(self) -> str:
         """
@@ -88,27 +317,16 @@ class TarotFortuneSystem(BaseFortuneSystem):
         Returns:
             System prompt string for chat mode
         """
-        return """你是"霄占"塔罗牌解读大师，一位拥有深厚神秘学知识的塔罗牌专家，有着20年的塔罗牌解读经验。
-你熟知78张塔罗牌的每一种含义、象征和诠释，精通各种牌阵的解读方法。
-你的风格睿智而神秘，充满着智慧与洞察力，但同时也很亲和，能用生动的语言将复杂的符号象征转化为直观的理解。
-
-现在你正在与求测者进行轻松的聊天互动。你可以谈论:
-- 塔罗牌的历史与符号学
-- 各种牌面的含义与解读
-- 不同牌阵的特点与适用场景
-- 如何理解塔罗牌的信息
-- 塔罗牌作为自我反思工具的应用
-
-在回答中，你可以使用一些巧妙的比喻和例子，偶尔引用神话或传说，帮助求测者理解深奥的概念。
-对话应简洁精炼，回答控制在200字以内，保持优雅而富有启发性的语气。
-记住，你提供的不是固定的预言，而是帮助人们探索可能性和深入理解自我的视角。"""
+        return _CHAT_SYSTEM_PROMPT
     
-    def __init__(self, data_dir: str = None):
+    def __init__(self, data_dir: str = None, rng: Optional[random.Random] = None):
         """
         Initialize the Tarot fortune system.
         
         Args:
             data_dir: Directory containing tarot card data
+            rng: Random number generator used for drawing cards; pass a
+                seeded ``random.Random`` for reproducible readings
         """
         super().__init__(
             name="tarot",
@@ -118,62 +336,22 @@ class TarotFortuneSystem(BaseFortuneSystem):
         
         # Set the data directory
         if data_dir is None:
-            self.data_dir = os.path.abspath(
-                os.path.join(os.path.dirname(__file__), "..", "..", "data", "tarot")
-            )
+            self.data_dir = _DEFAULT_DATA_DIR
         else:
             self.data_dir = os.path.abspath(data_dir)
         
-        # Load tarot card data
-        self.cards = self._load_cards()
+        # 每个实例独立的随机数生成器，避免共享全局随机状态
+        self._rng = rng or random.Random()
         
-        # Define available spreads
-        self.spreads = {
-            "single": {
-                "name": "单牌阅读",
-                "description": "抽取一张牌进行简单的阅读",
-                "positions": ["当前状况"]
-            },
-            "three_card": {
-                "name": "三牌阵",
-                "description": "过去、现在、未来的经典三牌阵",
-                "positions": ["过去", "现在", "未来"]
-            },
-            "celtic_cross": {
-                "name": "凯尔特十字",
-                "description": "详细分析当前情况和潜在结果的经典阵列",
-                "positions": [
-                    "当前状况", "挑战", "过去", "未来", 
-                    "意识目标", "潜意识影响", "自我认知",
-                    "外部影响", "希望与恐惧", "最终结果"
-                ]
-            },
-            "relationship": {
-                "name": "关系阵",
-                "description": "分析两个人之间关系的牌阵",
-                "positions": [
-                    "你自己", "对方", "关系基础", 
-                    "过去影响", "当前状态", "未来发展"
-                ]
-            }
-        }
-        
-        logger.info(f"Tarot system initialized with {len(self.cards)} cards")
-    
-    def get_required_inputs(self) -> Dict[str, Dict[str, Any]]:
-        """
-        Get information about required inputs for this fortune system.
-        
-        Returns:
-            Dictionary mapping input field names to their metadata
-        """
-        # Convert spreads to options format
-        spread_options = [
-            {"value": key, "label": info["name"], "description": info["description"]}
-            for key, info in self.spreads.items()
-        ]
+        # Load tarot card data (memoized, shared by every instance using the same file)
+        cards_file = os.path.join(self.data_dir, "cards.json")
+        self.cards = self._load_cards(cards_file)
+        self._n_cards = len(self.cards)
+        self._emoji_by_name = self._emoji_index(cards_file)
+        self.spreads = self._SPREADS
         
-        return {
+        # 输入项只依赖静态的牌阵数据，初始化时构建一次
+        self._required_inputs = {
             "question": {
                 "type": "text",
                 "description": "你想要咨询的问题",
@@ -182,13 +360,13 @@ class TarotFortuneSystem(BaseFortuneSystem):
             "spread": {
                 "type": "select",
                 "description": "塔罗牌阵",
-                "options": spread_options,
+                "options": self._SPREAD_OPTIONS,
                 "required": True
             },
             "focus_area": {
                 "type": "select",
                 "description": "问题领域",
-                "options": ["爱情", "事业", "健康", "财富", "灵性", "一般"],
+                "options": _FOCUS_OPTIONS,
                 "required": True
             },
             "name": {
@@ -197,6 +375,17 @@ class TarotFortuneSystem(BaseFortuneSystem):
                 "required": False
             }
         }
+        
+        logger.info(f"Tarot system initialized with {len(self.cards)} cards")
+    
+    def get_required_inputs(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get information about required inputs for this fortune system.
+        
+        Returns:
+            Dictionary mapping input field names to their metadata
+        """
+        return self._required_inputs
     
     def validate_input(self, user_input: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -229,10 +418,9 @@ class TarotFortuneSystem(BaseFortuneSystem):
         validated["spread"] = user_input["spread"]
         
         # Validate focus area
-        valid_focus_areas = ["爱情", "事业", "健康", "财富", "灵性", "一般"]
         if "focus_area" not in user_input:
             validated["focus_area"] = "一般"  # Default
-        elif user_input["focus_area"] not in valid_focus_areas:
+        elif user_input["focus_area"] not in _VALID_FOCUS:
             raise ValueError(f"不支持的问题领域: {user_input['focus_area']}")
         else:
             validated["focus_area"] = user_input["focus_area"]
@@ -261,21 +449,24 @@ class TarotFortuneSystem(BaseFortuneSystem):
         name = validated_input["name"]
         
         # Get the selected spread
-        spread = self.spreads[spread_key]
+        spread_name, spread_description, positions, position_count = self._SPREADS_FAST[spread_key]
         
         # Draw cards for each position
-        drawn_cards = self._draw_cards(len(spread["positions"]))
+        drawn_cards = self._draw_cards(position_count)
+        
+        # Draw all orientations in one call (upright about two thirds of the time)
+        orientations = self._rng.choices(_ORIENTATIONS, weights=_ORIENTATION_WEIGHTS, k=position_count)
         
         # Prepare the reading
         reading = []
-        for i, position in enumerate(spread["positions"]):
+        for i, position in enumerate(positions):
             card = drawn_cards[i]
             reading.append({
                 "position": position,
-                "card": card["name"],
-                "orientation": "正位" if random.random() > 0.33 else "逆位",
-                "description": card["description"],
-                "keywords": card["keywords"]
+                "card": card.name,
+                "orientation": orientations[i],
+                "description": card.description,
+                "keywords": card.keywords
             })
         
         # Format the result
@@ -285,12 +476,14 @@ class TarotFortuneSystem(BaseFortuneSystem):
             "name": name,
             "spread": {
                 "key": spread_key,
-                "name": spread["name"],
-                "description": spread["description"]
+                "name": spread_name,
+                "description": spread_description
             },
             "reading": reading
         }
-        logger.info(f"Processed data: {json.dumps(processed_data, ensure_ascii=False, indent=2)}")
+        # Serializing the whole reading is costly; only do it if INFO is enabled
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Processed data: %s", _json_dumps_pretty(processed_data))
         
         return processed_data
     
@@ -304,26 +497,7 @@ class TarotFortuneSystem(BaseFortuneSystem):
         Returns:
             Dictionary containing system_prompt and user_prompt for the LLM
         """
-        # Create the system prompt
-        system_prompt = f"""你是一位经验丰富的塔罗牌解读大师。
-请根据提供的塔罗牌阵和牌面，为咨询者提供专业、详细且有洞见的解读。
-
-非常重要：请仔细确认提示中列出的实际抽取的牌，并且只解读这些牌。
-- 你的解读必须严格基于用户提示中列出的特定牌，而不是其他任何牌。
-- 在开始解读前，请先在心里确认每个位置抽到的牌名和正逆位。
-- 确保你提到的每一张牌都是用户实际抽取的牌。
-- 不要在解读中引用或暗示任何未在用户提示中明确列出的牌。
-
-你的解读应该：
-1. 对每个牌位和对应的牌面进行解释
-2. 分析牌面之间的关系和相互影响
-3. 结合咨询者的具体问题背景进行针对性解读
-4. 提供实用的建议和可能的行动方向
-5. 保持中立、平衡的观点，不做绝对的预测
-
-你的解读应该具有启发性和支持性，帮助咨询者获得新的视角，而不是简单地告诉他们该做什么。
-请记住，塔罗牌解读提供的是可能性和潜在路径，而非确定性的未来。
-"""
+        system_prompt = _READING_SYSTEM_PROMPT
         
         # Get the question and spread information
         question = processed_data["question"]
@@ -333,30 +507,29 @@ class TarotFortuneSystem(BaseFortuneSystem):
         reading = processed_data["reading"]
         
         # Create user prompt with the analyzed data
-        user_prompt = f"""请为以下塔罗牌阵提供详细解读：
-
-咨询信息：
-- 咨询者：{name}
-- 问题：{question}
-- 领域：{focus_area}
-
-牌阵：{spread_info['name']} - {spread_info['description']}
-
-抽取的牌：
-"""
+        parts = [_USER_PROMPT_HEADER.format(
+            name=name,
+            question=question,
+            focus_area=focus_area,
+            spread_name=spread_info['name'],
+            spread_description=spread_info['description'],
+        )]
+        
+        # Add each card in the reading (keyword lists joined in one pass first)
+        keywords_joined = [', '.join(card['keywords']) for card in reading]
+        parts.extend(
+            _CARD_PROMPT_TMPL.format(
+                position=card['position'],
+                card=card['card'],
+                orientation=card['orientation'],
+                keywords=keywords,
+                description=card['description'],
+            )
+            for card, keywords in zip(reading, keywords_joined)
+        )
         
-        # Add each card in the reading
-        for card in reading:
-            user_prompt += f"""
-{card['position']}：{card['card']} ({card['orientation']})
-- 关键词：{', '.join(card['keywords'])}
-- 描述：{card['description']}
-"""
-        
-        user_prompt += f"""
-请根据以上塔罗牌阵，结合咨询者的问题"{question}"，给出详细而有洞见的解读。
-请先分别解读每个牌位的含义，然后综合分析整体牌阵所揭示的信息和建议。
-"""
+        parts.append(_USER_PROMPT_FOOTER.format(question=question))
+        user_prompt = "".join(parts)
         
         return {
             "system_prompt": system_prompt,
@@ -376,45 +549,46 @@ class TarotFortuneSystem(BaseFortuneSystem):
         # For tarot readings, we mostly preserve the LLM's text-based analysis
         # but add some structure for the UI
         
-        # Try to identify sections in the response
+        # Try to identify sections in the response. Each match of
+        # _SECTION_RE is a boundary line; section bodies are the slices
+        # of the response between boundaries. Bodies are kept under the raw
+        # heading (first-seen order), and each distinct heading is
+        # normalized as soon as it is first seen.
         sections = {}
         current_section = "整体解读"
-        section_text = []
-        
-        for line in llm_response.split('\n'):
-            # Check for various section header patterns
-            if line.strip().startswith('##'):
-                # Markdown headers
-                if section_text:
-                    sections[current_section] = '\n'.join(section_text).strip()
-                    section_text = []
-                current_section = line.strip('#').strip()
-            elif line.strip().startswith('#'):
-                # Single hash headers
-                if section_text:
-                    sections[current_section] = '\n'.join(section_text).strip()
-                    section_text = []
+        titles = {current_section: _normalize_section_title(current_section)}
+        body_start = 0  # Offset where the current section's lines begin (None: no lines)
+        
+        for match in _SECTION_RE.finditer(llm_response):
+            line = match.group(0)
+            stripped = line.strip()
+            if match.group("rule") is not None and len(stripped) <= 10:
+                # Too short to be a horizontal rule separator
+                continue
+            
+            line_start = match.start()
+            if body_start is not None and body_start < line_start:
+                sections[current_section] = llm_response[body_start:line_start].strip()
+            
+            if match.group("hash") is not None:
+                # Markdown headers; the header line itself is not content
                 current_section = line.strip('#').strip()
-            elif line.strip().startswith('【') and '】' in line:
-                # Chinese bracket headers - common in responses
-                if section_text:
-                    sections[current_section] = '\n'.join(section_text).strip()
-                    section_text = []
-                # Extract the text between 【 and 】
-                current_section = line.strip().split('【')[1].split('】')[0].strip()
-                section_text.append(line)  # Include the header line in content
-            elif line.strip() and '----' in line and len(line.strip()) > 10:
-                # Horizontal rule separator often indicates a new section
-                if section_text:
-                    sections[current_section] = '\n'.join(section_text).strip()
-                    section_text = []
-                section_text.append(line)  # Include the separator in the new section
+                if current_section not in titles:
+                    titles[current_section] = _normalize_section_title(current_section)
+                line_end = match.end()
+                body_start = line_end + 1 if line_end < len(llm_response) else None
             else:
-                section_text.append(line)
+                if match.group("bracket") is not None:
+                    # Chinese bracket headers - extract the text between 【 and 】
+                    current_section = stripped.split('【')[1].split('】')[0].strip()
+                    if current_section not in titles:
+                        titles[current_section] = _normalize_section_title(current_section)
+                # Bracket headers and separators are kept in the new section
+                body_start = line_start
         
         # Save the last section
-        if section_text:
-            sections[current_section] = '\n'.join(section_text).strip()
+        if body_start is not None:
+            sections[current_section] = llm_response[body_start:].strip()
         
         # If no sections were found, use the entire text as the general section
         if len(sections) <= 1:
@@ -422,69 +596,73 @@ class TarotFortuneSystem(BaseFortuneSystem):
                 "整体解读": llm_response.strip()
             }
         
-        # Process special patterns for consistency
-        processed_sections = {}
-        for title, content in sections.items():
-            # Clean up section titles for consistency
-            clean_title = title.replace("【", "").replace("】", "").strip()
-            
-            # For common titles, use standard names
-            if "整体" in clean_title or "综合" in clean_title:
-                clean_title = "整体解读"
-            elif "各牌位" in clean_title or "牌位" in clean_title:
-                clean_title = "各牌位详细解读"
-                
-            processed_sections[clean_title] = content
-            
+        # Key sections by their normalized titles. Headings that map to the
+        # same standard name resolve in first-seen order of the raw headings,
+        # so the last distinct raw heading wins.
+        sections = {titles[title]: content for title, content in sections.items()}
+        
         return {
-            "reading": processed_sections,
+            "reading": sections,
             "full_text": llm_response,
             "format_version": "1.1"
         }
     
-    def _load_cards(self) -> List[Dict[str, Any]]:
+    @staticmethod
+    @functools.lru_cache(maxsize=4)
+    def _load_cards(cards_file: str) -> Tuple["Card", ...]:
         """
-        Load tarot card data from the data directory.
+        Load tarot card data from a cards.json file.
+        
+        Parsed decks are memoized per file path, so every instance using the
+        same data directory references the same immutable tuple.
         
+        Args:
+            cards_file: Path to cards.json
+            
         Returns:
-            List of tarot card data dictionaries
+            Tuple of cards
         """
-        cards_file = os.path.join(self.data_dir, "cards.json")
-        
         # Load data from file
         try:
-            with open(cards_file, "r", encoding="utf-8") as f:
-                logger.info(f"Successfully loaded tarot cards from {cards_file}")
-                return json.load(f)
+            cards = tuple(Card.from_dict(raw) for raw in _json_loads(Path(cards_file).read_bytes()))
         except Exception as e:
             logger.error(f"Error loading tarot card data: {e}")
             # Instead of using a default hardcoded list, raise an error
             # This ensures we rely solely on the JSON data file
             raise ValueError(f"无法加载塔罗牌数据。请确保 {cards_file} 文件存在且格式正确。错误: {e}")
+        
+        logger.info(f"Successfully loaded tarot cards from {cards_file}")
+        return cards
     
-    def _draw_cards(self, count: int) -> List[Dict[str, Any]]:
+    @staticmethod
+    @functools.lru_cache(maxsize=4)
+    def _emoji_index(cards_file: str) -> Mapping[str, str]:
         """
-        Draw a specified number of unique cards.
+        Build (once per deck) a card name -> emoji lookup table.
         
         Args:
-            count: Number of cards to draw
+            cards_file: Path to cards.json
             
         Returns:
-            List of drawn card dictionaries
+            Read-only mapping of card names to their emoji
         """
-        # Create a copy of the card list to draw from
-        available_cards = self.cards.copy()
-        drawn = []
-        
-        # Ensure we don't try to draw more cards than available
-        draw_count = min(count, len(available_cards))
+        return MappingProxyType({
+            card.name: card.emoji
+            for card in TarotFortuneSystem._load_cards(cards_file)
+            if card.emoji
+        })
+    
+    def _draw_cards(self, count: int) -> List["Card"]:
+        """
+        Draw a specified number of unique cards.
         
-        for _ in range(draw_count):
-            # Draw a random card
-            card = random.choice(available_cards)
-            drawn.append(card)
+        Args:
+            count: Number of cards to draw
             
-            # Remove the card from available cards to prevent duplicates
-            available_cards.remove(card)
-        
-        return drawn
+        Returns:
+            List of drawn cards
+        """
+        # 抽取不重复的下标而不是复制整副牌，再按下标取牌
+        cards = self.cards
+        indices = self._rng.sample(range(self._n_cards), min(count, self._n_cards))
+        return [cards[i] for i in indices]
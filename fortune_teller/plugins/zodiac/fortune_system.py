@@ -2,15 +2,283 @@
 Zodiac/Astrology fortune telling system implementation.
 """
 import datetime
+import functools
 import logging
 import math
-from typing import Dict, Any, List, Tuple
+import re
+import sys
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping, NamedTuple, Optional, Tuple
 
 from fortune_teller.core import BaseFortuneSystem
+from fortune_teller.ui.colors import Colors
 
 # Configure logging
 logger = logging.getLogger("ZodiacFortuneSystem")
 
+# 行星 -> 显示用emoji
+_PLANET_EMOJI = {
+    "太阳": "☀️ ",
+    "月亮": "🌙 ",
+    "水星": "💫 ",
+    "金星": "💖 ",
+    "火星": "🔴 ",
+    "木星": "🪐 ",
+    "土星": "🪨 ",
+    "天王星": "⚡ ",
+    "海王星": "🌊 ",
+    "冥王星": "🔮 "
+}
+
+# 一次扫描匹配所有行星名（长名优先）
+_PLANET_RE = re.compile("|".join(map(re.escape, sorted(_PLANET_EMOJI, key=len, reverse=True))))
+
+
+# 元素 -> 显示颜色
+_ELEMENT_COLORS = {
+    "火": Colors.RED,
+    "土": Colors.YELLOW,
+    "风": Colors.CYAN,
+    "水": Colors.BLUE
+}
+
+# 相合性分组显示顺序：(相合等级, 显示标签, 颜色)
+_COMPATIBILITY_LEVELS = (
+    ("非常好", "非常相合", Colors.GREEN),
+    ("好", "相合", Colors.CYAN),
+    ("一般", "一般", Colors.YELLOW),
+    ("需要努力", "需要努力", Colors.RED),
+)
+
+# 解读中的标题行（去除首尾空白后以 # 开头）
+_HEADER_RE = re.compile(r"^[^\S\n]*#.*$", re.MULTILINE)
+
+
+# 行星 -> (每个星座停留天数, 位置偏移)
+# 月亮移动最快；水星、金星较快，偏移由 hash 决定（同一进程内固定，只需计算一次）
+_PLANET_PARAMS = {
+    "Moon": (3, 0),
+    "Mercury": (30, hash("Mercury") % 5),
+    "Venus": (30, hash("Venus") % 5),
+    "Mars": (60, 3),
+    "Jupiter": (365, 7),
+    "Saturn": (730, 10),
+}
+
+# 关注领域选项（显示顺序）及校验用集合
+_AREA_OPTIONS = ("爱情", "事业", "健康", "财富", "人际关系", "整体运势")
+_VALID_AREAS = frozenset(_AREA_OPTIONS)
+
+# 解读用系统提示词（静态内容，只构建一次）
+_READING_SYSTEM_PROMPT = """你是一位专业的占星师，精通西方占星学和星座分析。
+请根据提供的星座信息，为咨询者提供详细且有洞见的占星解读。
+你的分析应该包含以下内容：
+1. 星座的基本特质和个性倾向
+2. 元素和品质对性格的影响
+3. 月亮星座和上升星座（如果已知）的额外影响
+4. 行星位置和当前相位对各生活领域的影响
+5. 针对咨询者关注领域的具体建议和见解
+6. 近期运势趋势和重要时间点
+
+你的分析应当平衡、客观，避免过于绝对化的预测。提供实用的建议和观点，帮助咨询者更好地理解自己和当前的能量影响。
+请记住，占星解读是提供可能性的指引，而非确定性的命运。
+"""
+
+# 用户提示词模板：只有星盘信息、相合性和星象是动态的
+_USER_PROMPT_HEADER = """请为以下星座信息提供占星解读：
+
+基本信息：
+- 出生日期：{birth_date}
+- 出生时间：{birth_time}
+- 出生地点：{birth_place}
+- 关注领域：{question_area}
+
+星座信息：
+- 太阳星座：{sign_name} ({sign_english})，{date_range}
+- 月亮星座：{moon_sign}
+- 上升星座：{rising_sign}
+
+{sign_name}的基本特质：
+- 主宰星：{ruler}
+- 元素：{element}（{element_keywords}）
+- 品质：{quality}（{quality_info}）
+
+星座相合性：
+"""
+
+_TRANSITS_HEADER = """
+当前星象与影响：
+"""
+
+_USER_PROMPT_FOOTER = """
+请根据以上信息，为咨询者提供详细的占星解读，特别针对"{question_area}"领域给出具体的见解和建议。
+包括近期的能量变化趋势、可能的机遇或挑战，以及如何最佳利用当前的星象能量。
+"""
+
+
+class _ElementInfo(NamedTuple):
+    """Immutable view of one ELEMENTS entry with guaranteed fields."""
+    keywords: Tuple[str, ...]
+    compatible: Tuple[str, ...]
+    incompatible: Tuple[str, ...]
+    emoji: str
+    
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "_ElementInfo":
+        """Build element info from an ELEMENTS-style dictionary; missing fields are empty."""
+        return cls(
+            keywords=tuple(data.get("keywords", ())),
+            compatible=tuple(data.get("compatible", ())),
+            incompatible=tuple(data.get("incompatible", ())),
+            emoji=data.get("emoji", ""),
+        )
+
+
+def _parse_date(text: str) -> datetime.date:
+    """
+    Parse a YYYY-MM-DD date string.
+    
+    Canonical strings take the fromisoformat fast path; anything else goes
+    through strptime so the accepted formats stay unchanged.
+    
+    Args:
+        text: Date string
+        
+    Returns:
+        Parsed date
+        
+    Raises:
+        ValueError: If the string is not a valid date
+    """
+    if len(text) == 10 and text[4] == "-" and text[7] == "-":
+        try:
+            return datetime.date.fromisoformat(text)
+        except ValueError:
+            pass
+    return datetime.datetime.strptime(text, "%Y-%m-%d").date()
+
+
+def _parse_time(text: str) -> datetime.time:
+    """
+    Parse an HH:MM time string.
+    
+    Args:
+        text: Time string
+        
+    Returns:
+        Parsed time
+        
+    Raises:
+        ValueError: If the string is not a valid time
+    """
+    if len(text) == 5 and text[2] == ":":
+        try:
+            return datetime.time.fromisoformat(text)
+        except ValueError:
+            pass
+    return datetime.datetime.strptime(text, "%H:%M").time()
+
+
+def _add_planet_emoji(match: "re.Match") -> str:
+    """Append the planet emoji to a matched planet name."""
+    planet = match.group(0)
+    return f"{planet}{_PLANET_EMOJI[planet]}"
+
+
+def _find_sign(signs: List[Dict[str, Any]], month: int, day: int) -> Optional[Dict[str, Any]]:
+    """
+    Find the zodiac sign whose date range contains the given month and day.
+    
+    Args:
+        signs: Zodiac sign definitions
+        month: Month (1-12)
+        day: Day of month (1-31)
+        
+    Returns:
+        Zodiac sign information dictionary, or None if no sign matches
+    """
+    for sign in signs:
+        start_month, start_day = sign["start_date"]
+        end_month, end_day = sign["end_date"]
+        
+        # Handle cases where sign spans across year boundary (e.g., Capricorn)
+        if start_month > end_month:
+            # If date is in start month and after/on start day, or
+            # If date is in end month and before/on end day
+            if (month == start_month and day >= start_day) or \
+               (month == end_month and day <= end_day):
+                return sign
+        else:
+            # Normal case: if date is between start and end dates
+            if (month == start_month and day >= start_day) or \
+               (month == end_month and day <= end_day) or \
+               (start_month < month < end_month):
+                return sign
+    return None
+
+
+def _build_sign_table(signs: List[Dict[str, Any]]) -> Tuple[Optional[Dict[str, Any]], ...]:
+    """
+    Precompute the zodiac sign for every month/day pair.
+    
+    Args:
+        signs: Zodiac sign definitions
+        
+    Returns:
+        Tuple indexed by ``month * 32 + day`` (month 0-12, day 0-31)
+    """
+    return tuple(
+        _find_sign(signs, month, day) if month and day else None
+        for month in range(13)
+        for day in range(32)
+    )
+
+
+def _build_compatibility(signs: List[Dict[str, Any]],
+                         elements: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, str]]:
+    """
+    Precompute the compatibility of every sign with every other sign.
+    
+    Args:
+        signs: Zodiac sign definitions
+        elements: Element definitions with compatible/incompatible lists
+        
+    Returns:
+        Dictionary mapping each sign name to {other sign name: level}
+    """
+    # 元素 -> 相容/冲突元素集合，循环中只做哈希查找
+    compatible = {name: frozenset(data["compatible"]) for name, data in elements.items()}
+    incompatible = {name: frozenset(data["incompatible"]) for name, data in elements.items()}
+    
+    table = {}
+    for sign in signs:
+        element = sign["element"]
+        compatible_elements = compatible[element]
+        incompatible_elements = incompatible[element]
+        compatibility = {}
+        
+        for other_sign in signs:
+            other_element = other_sign["element"]
+            other_name = other_sign["name"]
+            
+            # Skip self comparison
+            if other_name == sign["name"]:
+                compatibility[other_name] = "自己"
+                continue
+            
+            # Determine compatibility based on elements
+            if other_element == element:
+                compatibility[other_name] = "非常好"
+            elif other_element in compatible_elements:
+                compatibility[other_name] = "好"
+            elif other_element in incompatible_elements:
+                compatibility[other_name] = "需要努力"
+            else:
+                compatibility[other_name] = "一般"
+        
+        table[sign["name"]] = compatibility
+    return table
+
 
 class ZodiacFortuneSystem(BaseFortuneSystem):
     """
@@ -18,6 +286,9 @@ class ZodiacFortuneSystem(BaseFortuneSystem):
     Based on western astrology and zodiac signs.
     """
     
+    # 实例只保存基类的三个属性，其余数据都是类级别常量
+    __slots__ = ()
+    
     # Constants for zodiac calculations
     ZODIAC_SIGNS = [
         {"name": "白羊座", "english": "Aries", "start_date": (3, 21), "end_date": (4, 19),
@@ -46,6 +317,18 @@ class ZodiacFortuneSystem(BaseFortuneSystem):
          "element": "水", "quality": "变动", "ruler": "海王星", "emoji": "🐟"}
     ]
     
+    # 星座名 -> 星座数据 索引
+    _SIGN_BY_NAME = {s["name"]: s for s in ZODIAC_SIGNS}
+    
+    # 月/日 -> 星座 查找表，类创建时构建一次
+    _SIGN_BY_MONTHDAY = _build_sign_table(ZODIAC_SIGNS)
+    
+    # 星座名 -> 日期范围文本，星座数据是静态的，只需格式化一次
+    _DATE_RANGE_BY_NAME = {
+        s["name"]: f"{s['start_date'][0]}月{s['start_date'][1]}日 - {s['end_date'][0]}月{s['end_date'][1]}日"
+        for s in ZODIAC_SIGNS
+    }
+    
     PLANETS = ["太阳", "月亮", "水星", "金星", "火星", "木星", "土星", "天王星", "海王星", "冥王星"]
     
     HOUSES = [
@@ -70,6 +353,12 @@ class ZodiacFortuneSystem(BaseFortuneSystem):
         "水": {"keywords": ["情感", "直觉", "敏感", "同理心"], "compatible": ["土"], "incompatible": ["火"], "emoji": "💧"}
     }
     
+    # 元素 -> 不可变元素信息，显示时直接按字段访问
+    _ELEMENT_INFO = {name: _ElementInfo.from_dict(data) for name, data in ELEMENTS.items()}
+    
+    # 星座相合性只取决于静态的星座和元素数据，类创建时计算一次
+    _COMPATIBILITY_BY_SIGN = _build_compatibility(ZODIAC_SIGNS, ELEMENTS)
+    
     QUALITIES = {
         "主动": "主动性格，喜欢发起行动，有领导力",
         "固定": "坚定稳固，有耐力，但可能固执",
@@ -83,7 +372,8 @@ class ZodiacFortuneSystem(BaseFortuneSystem):
         Args:
             processed_data: Processed zodiac reading data
         """
-        from fortune_teller.ui.colors import Colors
+        # 先缓冲所有输出行，最后一次性写出
+        lines = []
         
         # 获取基本信息
         birth_date = processed_data.get("birth_date", "未知")
@@ -96,25 +386,17 @@ class ZodiacFortuneSystem(BaseFortuneSystem):
         moon_sign = processed_data.get("moon_sign", "未知")
         rising_sign = processed_data.get("rising_sign", "未知")
         
-        # 定义元素颜色
-        element_colors = {
-            "火": Colors.RED,
-            "土": Colors.YELLOW,
-            "风": Colors.CYAN,
-            "水": Colors.BLUE
-        }
-        
         # 显示标题
-        print(f"\n{Colors.BOLD}{Colors.YELLOW}✨ 星座与星盘信息 ✨{Colors.ENDC}")
-        print(f"{Colors.CYAN}" + "=" * 60 + f"{Colors.ENDC}\n")
+        lines.append(f"\n{Colors.BOLD}{Colors.YELLOW}✨ 星座与星盘信息 ✨{Colors.ENDC}")
+        lines.append(f"{Colors.CYAN}" + "=" * 60 + f"{Colors.ENDC}\n")
         
         # 显示基本信息
-        print(f"{Colors.BOLD}【基本信息】{Colors.ENDC}")
-        print(f"出生日期: {birth_date}")
-        print(f"出生时间: {birth_time}")
-        print(f"出生地点: {birth_place}")
-        print(f"关注领域: {Colors.YELLOW}{question_area}{Colors.ENDC}")
-        print()
+        lines.append(f"{Colors.BOLD}【基本信息】{Colors.ENDC}")
+        lines.append(f"出生日期: {birth_date}")
+        lines.append(f"出生时间: {birth_time}")
+        lines.append(f"出生地点: {birth_place}")
+        lines.append(f"关注领域: {Colors.YELLOW}{question_area}{Colors.ENDC}")
+        lines.append("")
         
         # 显示星座信息
         sign_name = sign_info.get("name", "未知")
@@ -124,159 +406,102 @@ class ZodiacFortuneSystem(BaseFortuneSystem):
         ruler = sign_info.get("ruler", "未知")
         date_range = sign_info.get("date_range", "未知")
         
-        print(f"{Colors.BOLD}【太阳星座】{Colors.ENDC}")
-        element_color = element_colors.get(element, Colors.ENDC)
+        lines.append(f"{Colors.BOLD}【太阳星座】{Colors.ENDC}")
+        element_color = _ELEMENT_COLORS.get(element, Colors.ENDC)
         sign_emoji = sign_info.get("emoji", "")
-        print(f"星座: {Colors.BOLD}{element_color}{sign_name} {sign_emoji}{Colors.ENDC} ({sign_english})")
+        lines.append(f"星座: {Colors.BOLD}{element_color}{sign_name} {sign_emoji}{Colors.ENDC} ({sign_english})")
         
         # 确保星座符号一定会显示
-        if sign_name in [s["name"] for s in self.ZODIAC_SIGNS]:
-            zodiac_data = next((s for s in self.ZODIAC_SIGNS if s["name"] == sign_name), None)
-            if zodiac_data and zodiac_data["emoji"]:
-                print(f"星座符号: {zodiac_data['emoji']}")
-        print(f"日期范围: {date_range}")
-        print(f"主宰星: {ruler}")
-        print(f"元素: {element_color}{element}{Colors.ENDC}")
-        print(f"品质: {quality} - {processed_data.get('quality_info', '')}")
-        print()
+        if sign_name in self._SIGN_BY_NAME:
+            zodiac_data = self._SIGN_BY_NAME[sign_name]
+            if zodiac_data["emoji"]:
+                lines.append(f"星座符号: {zodiac_data['emoji']}")
+        lines.append(f"日期范围: {date_range}")
+        lines.append(f"主宰星: {ruler}")
+        lines.append(f"元素: {element_color}{element}{Colors.ENDC}")
+        lines.append(f"品质: {quality} - {processed_data.get('quality_info', '')}")
+        lines.append("")
         
         # 显示月亮和上升星座
-        print(f"{Colors.BOLD}【月亮和上升星座】{Colors.ENDC}")
-        moon_sign_data = next((s for s in self.ZODIAC_SIGNS if s["name"] == moon_sign), None)
-        rising_sign_data = next((s for s in self.ZODIAC_SIGNS if s["name"] == rising_sign), None)
+        lines.append(f"{Colors.BOLD}【月亮和上升星座】{Colors.ENDC}")
+        moon_sign_data = self._SIGN_BY_NAME.get(moon_sign)
+        rising_sign_data = self._SIGN_BY_NAME.get(rising_sign)
         
         moon_emoji = moon_sign_data["emoji"] if moon_sign_data else ""
         rising_emoji = rising_sign_data["emoji"] if rising_sign_data else ""
         
-        print(f"月亮星座: {moon_sign} {moon_emoji}")
-        print(f"上升星座: {rising_sign} {rising_emoji}")
-        print()
+        lines.append(f"月亮星座: {moon_sign} {moon_emoji}")
+        lines.append(f"上升星座: {rising_sign} {rising_emoji}")
+        lines.append("")
         
         # 显示元素特性
-        element_info = processed_data.get("element_info", {})
-        element_emoji = self.ELEMENTS[element].get("emoji", "")
-        print(f"{Colors.BOLD}【{element}{element_emoji} 元素特性】{Colors.ENDC}")
-        keywords = element_info.get("keywords", [])
-        if keywords:
-            print(f"关键词: {element_color}{', '.join(keywords)}{Colors.ENDC}")
-        
-        compatible = element_info.get("compatible", [])
-        if compatible:
+        element_info = _ElementInfo.from_dict(processed_data.get("element_info", {}))
+        element_emoji = self._ELEMENT_INFO[element].emoji
+        lines.append(f"{Colors.BOLD}【{element}{element_emoji} 元素特性】{Colors.ENDC}")
+        if element_info.keywords:
+            lines.append(f"关键词: {element_color}{', '.join(element_info.keywords)}{Colors.ENDC}")
+        
+        if element_info.compatible:
             compatible_elements = []
-            for c in compatible:
-                c_color = element_colors.get(c, Colors.ENDC)
+            for c in element_info.compatible:
+                c_color = _ELEMENT_COLORS.get(c, Colors.ENDC)
                 compatible_elements.append(f"{c_color}{c}{Colors.ENDC}")
-            print(f"相容元素: {', '.join(compatible_elements)}")
+            lines.append(f"相容元素: {', '.join(compatible_elements)}")
         
-        incompatible = element_info.get("incompatible", [])
-        if incompatible:
+        if element_info.incompatible:
             incompatible_elements = []
-            for i in incompatible:
-                i_color = element_colors.get(i, Colors.ENDC)
+            for i in element_info.incompatible:
+                i_color = _ELEMENT_COLORS.get(i, Colors.ENDC)
                 incompatible_elements.append(f"{i_color}{i}{Colors.ENDC}")
-            print(f"冲突元素: {', '.join(incompatible_elements)}")
-        print()
+            lines.append(f"冲突元素: {', '.join(incompatible_elements)}")
+        lines.append("")
         
         # 显示星座相合性
         compatibility = processed_data.get("compatibility", {})
-        print(f"{Colors.BOLD}【星座相合性】{Colors.ENDC}")
+        lines.append(f"{Colors.BOLD}【星座相合性】{Colors.ENDC}")
         
         # 将相合性分组显示
-        very_good = []
-        good = []
-        neutral = []
-        challenging = []
-        
+        buckets = {level: [] for level, _, _ in _COMPATIBILITY_LEVELS}
         for sign, level in compatibility.items():
-            if level == "非常好":
-                very_good.append(sign)
-            elif level == "好":
-                good.append(sign)
-            elif level == "一般":
-                neutral.append(sign)
-            elif level == "需要努力":
-                challenging.append(sign)
-        
-        if very_good:
-            # Add emojis to sign names
-            formatted_signs = []
-            for sign_name in very_good:
-                sign_data = next((s for s in self.ZODIAC_SIGNS if s["name"] == sign_name), None)
-                if sign_data and "emoji" in sign_data:
-                    formatted_signs.append(f"{sign_name} {sign_data['emoji']}")
-                else:
-                    formatted_signs.append(sign_name)
-            print(f"{Colors.GREEN}非常相合:{Colors.ENDC} {', '.join(formatted_signs)}")
-            
-        if good:
-            formatted_signs = []
-            for sign_name in good:
-                sign_data = next((s for s in self.ZODIAC_SIGNS if s["name"] == sign_name), None)
-                if sign_data and "emoji" in sign_data:
-                    formatted_signs.append(f"{sign_name} {sign_data['emoji']}")
-                else:
-                    formatted_signs.append(sign_name)
-            print(f"{Colors.CYAN}相合:{Colors.ENDC} {', '.join(formatted_signs)}")
-            
-        if neutral:
-            formatted_signs = []
-            for sign_name in neutral:
-                sign_data = next((s for s in self.ZODIAC_SIGNS if s["name"] == sign_name), None)
-                if sign_data and "emoji" in sign_data:
-                    formatted_signs.append(f"{sign_name} {sign_data['emoji']}")
-                else:
-                    formatted_signs.append(sign_name)
-            print(f"{Colors.YELLOW}一般:{Colors.ENDC} {', '.join(formatted_signs)}")
-            
-        if challenging:
-            formatted_signs = []
-            for sign_name in challenging:
-                sign_data = next((s for s in self.ZODIAC_SIGNS if s["name"] == sign_name), None)
-                if sign_data and "emoji" in sign_data:
-                    formatted_signs.append(f"{sign_name} {sign_data['emoji']}")
-                else:
-                    formatted_signs.append(sign_name)
-            print(f"{Colors.RED}需要努力:{Colors.ENDC} {', '.join(formatted_signs)}")
-        print()
+            if level in buckets:
+                buckets[level].append(sign)
+        
+        for level, label, color in _COMPATIBILITY_LEVELS:
+            signs = buckets[level]
+            if signs:
+                # Add emojis to sign names
+                formatted_signs = [
+                    f"{name} {self._SIGN_BY_NAME[name]['emoji']}" if name in self._SIGN_BY_NAME else name
+                    for name in signs
+                ]
+                lines.append(f"{color}{label}:{Colors.ENDC} {', '.join(formatted_signs)}")
+        lines.append("")
         
         # 显示当前星象
         current_transits = processed_data.get("current_transits", [])
-        print(f"{Colors.BOLD}【当前星象】{Colors.ENDC}")
+        lines.append(f"{Colors.BOLD}【当前星象】{Colors.ENDC}")
         
         # 定义行星emoji - 使用更广泛支持的符号
-        planet_emojis = {
-            "太阳": "☀️ ",
-            "月亮": "🌙 ",
-            "水星": "💫 ",
-            "金星": "💖 ",
-            "火星": "🔴 ",
-            "木星": "🪐 ",
-            "土星": "🪨 ",
-            "天王星": "⚡ ",
-            "海王星": "🌊 ",
-            "冥王星": "🔮 "
-        }
-        
         for i, transit in enumerate(current_transits, 1):
             desc = transit.get('description', '')
             
             # 为行星添加emoji
-            for planet, emoji in planet_emojis.items():
-                if planet in desc:
-                    desc = desc.replace(planet, f"{planet}{emoji}")
+            desc = _PLANET_RE.sub(_add_planet_emoji, desc)
             
             # 获取星座emoji
-            parts = desc.split("在")
-            if len(parts) > 1:
-                sign_name = parts[1].strip()
-                sign_data = next((s for s in self.ZODIAC_SIGNS if s["name"] == sign_name), None)
+            head, sep, tail = desc.partition("在")
+            if sep:
+                sign_name = tail.partition("在")[0].strip()
+                sign_data = self._SIGN_BY_NAME.get(sign_name)
                 if sign_data and "emoji" in sign_data:
-                    desc = f"{parts[0]}在{sign_name} {sign_data['emoji']}"
+                    desc = f"{head}在{sign_name} {sign_data['emoji']}"
             
-            print(f"{i}. {Colors.YELLOW}{desc}{Colors.ENDC}")
-            print(f"   影响: {transit.get('influence', '')}")
+            lines.append(f"{i}. {Colors.YELLOW}{desc}{Colors.ENDC}")
+            lines.append(f"   影响: {transit.get('influence', '')}")
         
-        print(f"\n{Colors.CYAN}" + "-" * 60 + f"{Colors.ENDC}")
+        lines.append(f"\n{Colors.CYAN}" + "-" * 60 + f"{Colors.ENDC}")
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
     
     def get_chat_system_prompt(self) -> str:
         """
@@ -333,7 +558,7 @@ class ZodiacFortuneSystem(BaseFortuneSystem):
             "question_area": {
                 "type": "select",
                 "description": "关注领域",
-                "options": ["爱情", "事业", "健康", "财富", "人际关系", "整体运势"],
+                "options": _AREA_OPTIONS,
                 "required": False
             }
         }
@@ -360,9 +585,7 @@ class ZodiacFortuneSystem(BaseFortuneSystem):
         try:
             # Handle string date
             if isinstance(user_input["birth_date"], str):
-                validated["birth_date"] = datetime.datetime.strptime(
-                    user_input["birth_date"], "%Y-%m-%d"
-                ).date()
+                validated["birth_date"] = _parse_date(user_input["birth_date"])
             # Handle datetime or date object
             elif hasattr(user_input["birth_date"], "year"):
                 validated["birth_date"] = user_input["birth_date"]
@@ -376,9 +599,7 @@ class ZodiacFortuneSystem(BaseFortuneSystem):
             try:
                 # Handle string time
                 if isinstance(user_input["birth_time"], str):
-                    time_obj = datetime.datetime.strptime(
-                        user_input["birth_time"], "%H:%M"
-                    ).time()
+                    time_obj = _parse_time(user_input["birth_time"])
                 # Handle time object
                 elif hasattr(user_input["birth_time"], "hour"):
                     time_obj = user_input["birth_time"]
@@ -398,9 +619,8 @@ class ZodiacFortuneSystem(BaseFortuneSystem):
             validated["birth_place"] = None
         
         # Validate question_area (optional)
-        valid_areas = ["爱情", "事业", "健康", "财富", "人际关系", "整体运势"]
         if "question_area" in user_input and user_input["question_area"]:
-            if user_input["question_area"] not in valid_areas:
+            if user_input["question_area"] not in _VALID_AREAS:
                 raise ValueError(f"不支持的关注领域: {user_input['question_area']}")
             validated["question_area"] = user_input["question_area"]
         else:
@@ -459,7 +679,7 @@ class ZodiacFortuneSystem(BaseFortuneSystem):
                 "element": element,
                 "quality": quality,
                 "ruler": zodiac_sign["ruler"],
-                "date_range": f"{zodiac_sign['start_date'][0]}月{zodiac_sign['start_date'][1]}日 - {zodiac_sign['end_date'][0]}月{zodiac_sign['end_date'][1]}日"
+                "date_range": self._DATE_RANGE_BY_NAME[zodiac_sign["name"]]
             },
             "moon_sign": moon_sign["name"] if moon_sign else "未知",
             "rising_sign": rising_sign["name"] if rising_sign else "未知",
@@ -482,19 +702,7 @@ class ZodiacFortuneSystem(BaseFortuneSystem):
             Dictionary containing system_prompt and user_prompt for the LLM
         """
         # Create the system prompt
-        system_prompt = f"""你是一位专业的占星师，精通西方占星学和星座分析。
-请根据提供的星座信息，为咨询者提供详细且有洞见的占星解读。
-你的分析应该包含以下内容：
-1. 星座的基本特质和个性倾向
-2. 元素和品质对性格的影响
-3. 月亮星座和上升星座（如果已知）的额外影响
-4. 行星位置和当前相位对各生活领域的影响
-5. 针对咨询者关注领域的具体建议和见解
-6. 近期运势趋势和重要时间点
-
-你的分析应当平衡、客观，避免过于绝对化的预测。提供实用的建议和观点，帮助咨询者更好地理解自己和当前的能量影响。
-请记住，占星解读是提供可能性的指引，而非确定性的命运。
-"""
+        system_prompt = _READING_SYSTEM_PROMPT
         
         # Get the zodiac information
         sign_info = processed_data["zodiac_sign"]
@@ -507,43 +715,38 @@ class ZodiacFortuneSystem(BaseFortuneSystem):
         question_area = processed_data["question_area"]
         
         # Create user prompt with the analyzed data
-        user_prompt = f"""请为以下星座信息提供占星解读：
-
-基本信息：
-- 出生日期：{processed_data['birth_date']}
-- 出生时间：{processed_data['birth_time']}
-- 出生地点：{processed_data['birth_place']}
-- 关注领域：{question_area}
-
-星座信息：
-- 太阳星座：{sign_info['name']} ({sign_info['english']})，{sign_info['date_range']}
-- 月亮星座：{moon_sign}
-- 上升星座：{rising_sign}
-
-{sign_info['name']}的基本特质：
-- 主宰星：{sign_info['ruler']}
-- 元素：{sign_info['element']}（{', '.join(element_info['keywords'])}）
-- 品质：{sign_info['quality']}（{quality_info}）
-
-星座相合性：
-"""
+        user_prompt = _USER_PROMPT_HEADER.format(
+            birth_date=processed_data['birth_date'],
+            birth_time=processed_data['birth_time'],
+            birth_place=processed_data['birth_place'],
+            question_area=question_area,
+            sign_name=sign_info['name'],
+            sign_english=sign_info['english'],
+            date_range=sign_info['date_range'],
+            moon_sign=moon_sign,
+            rising_sign=rising_sign,
+            ruler=sign_info['ruler'],
+            element=sign_info['element'],
+            element_keywords=', '.join(element_info['keywords']),
+            quality=sign_info['quality'],
+            quality_info=quality_info
+        )
         
         # Add compatibility information
-        for sign, level in compatibility.items():
-            user_prompt += f"- 与{sign}：{level}\n"
+        compat_lines = "".join(f"- 与{sign}：{level}\n" for sign, level in compatibility.items())
         
         # Add current transits
-        user_prompt += f"""
-当前星象与影响：
-"""
-        
-        for transit in current_transits:
-            user_prompt += f"- {transit['description']}: {transit['influence']}\n"
+        transit_lines = "".join(
+            f"- {transit['description']}: {transit['influence']}\n" for transit in current_transits
+        )
         
-        user_prompt += f"""
-请根据以上信息，为咨询者提供详细的占星解读，特别针对"{question_area}"领域给出具体的见解和建议。
-包括近期的能量变化趋势、可能的机遇或挑战，以及如何最佳利用当前的星象能量。
-"""
+        user_prompt = "".join((
+            user_prompt,
+            compat_lines,
+            _TRANSITS_HEADER,
+            transit_lines,
+            _USER_PROMPT_FOOTER.format(question_area=question_area)
+        ))
         
         return {
             "system_prompt": system_prompt,
@@ -562,48 +765,53 @@ class ZodiacFortuneSystem(BaseFortuneSystem):
         """
         # For zodiac readings, we'll divide the response into sections
         # based on common section headers in astrology readings
+        sections = dict(self._parse_sections(llm_response))
+        
+        return {
+            "reading": sections,
+            "full_text": llm_response,
+            "format_version": "1.0"
+        }
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=32)
+    def _parse_sections(llm_response: str) -> Tuple[Tuple[str, str], ...]:
+        """
+        Split an LLM response into (section title, section text) pairs.
+        
+        Results are cached so re-displaying the same reading skips the scan.
         
-        # Try to identify sections in the response
+        Args:
+            llm_response: Raw response from the LLM
+            
+        Returns:
+            Immutable tuple of (title, text) pairs in order of appearance
+        """
+        # Locate every header line in one regex scan and slice the text
+        # between them; a section is kept whenever it spans at least one line
         sections = {}
         current_section = "总体解读"
-        section_text = []
-        
-        for line in llm_response.split('\n'):
-            # Check if line is a section header
-            if line.strip().startswith('##'):
-                # Save previous section
-                if section_text:
-                    sections[current_section] = '\n'.join(section_text).strip()
-                    section_text = []
-                
-                # Extract new section name
-                current_section = line.strip('#').strip()
-            elif line.strip().startswith('#'):
-                # Save previous section
-                if section_text:
-                    sections[current_section] = '\n'.join(section_text).strip()
-                    section_text = []
-                
-                # Extract new section name
-                current_section = line.strip('#').strip()
-            else:
-                section_text.append(line)
+        start = 0
+        
+        for match in _HEADER_RE.finditer(llm_response):
+            # Body ends just before the newline that precedes the header
+            end = match.start() - 1
+            if end >= start:
+                sections[current_section] = llm_response[start:end].strip()
+            
+            # Extract new section name
+            current_section = match.group(0).strip('#').strip()
+            start = match.end() + 1
         
         # Save the last section
-        if section_text:
-            sections[current_section] = '\n'.join(section_text).strip()
+        if len(llm_response) >= start:
+            sections[current_section] = llm_response[start:].strip()
         
         # If no sections were found, use the entire text as the general section
         if len(sections) <= 1:
-            sections = {
-                "总体解读": llm_response.strip()
-            }
+            return (("总体解读", llm_response.strip()),)
         
-        return {
-            "reading": sections,
-            "full_text": llm_response,
-            "format_version": "1.0"
-        }
+        return tuple(sections.items())
     
     def _get_zodiac_sign(self, month: int, day: int) -> Dict[str, Any]:
         """
@@ -616,23 +824,10 @@ class ZodiacFortuneSystem(BaseFortuneSystem):
         Returns:
             Zodiac sign information dictionary
         """
-        for sign in self.ZODIAC_SIGNS:
-            start_month, start_day = sign["start_date"]
-            end_month, end_day = sign["end_date"]
-            
-            # Handle cases where sign spans across year boundary (e.g., Capricorn)
-            if start_month > end_month:
-                # If date is in start month and after/on start day, or
-                # If date is in end month and before/on end day
-                if (month == start_month and day >= start_day) or \
-                   (month == end_month and day <= end_day):
-                    return sign
-            else:
-                # Normal case: if date is between start and end dates
-                if (month == start_month and day >= start_day) or \
-                   (month == end_month and day <= end_day) or \
-                   (start_month < month < end_month):
-                    return sign
+        if 1 <= month <= 12 and 1 <= day <= 31:
+            sign = self._SIGN_BY_MONTHDAY[month * 32 + day]
+            if sign is not None:
+                return sign
         
         # Default fallback (should never reach here if data is correct)
         logger.warning(f"Could not determine zodiac sign for {month}/{day}")
@@ -689,30 +884,9 @@ class ZodiacFortuneSystem(BaseFortuneSystem):
             
         Returns:
             Dictionary mapping sign names to compatibility levels
+            (precomputed and shared; do not modify)
         """
-        element = sign["element"]
-        compatibility = {}
-        
-        for other_sign in self.ZODIAC_SIGNS:
-            other_element = other_sign["element"]
-            other_name = other_sign["name"]
-            
-            # Skip self comparison
-            if other_name == sign["name"]:
-                compatibility[other_name] = "自己"
-                continue
-            
-            # Determine compatibility based on elements
-            if other_element == element:
-                compatibility[other_name] = "非常好"
-            elif other_element in self.ELEMENTS[element]["compatible"]:
-                compatibility[other_name] = "好"
-            elif other_element in self.ELEMENTS[element]["incompatible"]:
-                compatibility[other_name] = "需要努力"
-            else:
-                compatibility[other_name] = "一般"
-        
-        return compatibility
+        return self._COMPATIBILITY_BY_SIGN[sign["name"]]
     
     def _get_current_transits(self, sign: Dict[str, Any], 
                              current_date: datetime.date) -> List[Dict[str, str]]:
@@ -727,60 +901,76 @@ class ZodiacFortuneSystem(BaseFortuneSystem):
         Returns:
             List of transit information dictionaries
         """
+        # 同一天同一星座的星象完全相同，缓存后每次返回新的可变副本
+        cached = self._cached_transits(sign["name"], sign["element"], current_date.toordinal())
+        return [dict(transit) for transit in cached]
+    
+    @classmethod
+    @functools.lru_cache(maxsize=12 * 31)
+    def _cached_transits(cls, sign_name: str, sign_element: str,
+                         day_ordinal: int) -> Tuple[Mapping[str, str], ...]:
+        """
+        Compute the transits for one sign on one day.
+        
+        Cached per class rather than per instance, so every reading in the
+        process shares one computation per (sign, day).
+        
+        Args:
+            sign_name: Zodiac sign name
+            sign_element: Element of the zodiac sign
+            day_ordinal: Proleptic Gregorian ordinal of the current date
+            
+        Returns:
+            Read-only transit information mappings
+        """
+        current_date = datetime.date.fromordinal(day_ordinal)
+        day_of_year = current_date.timetuple().tm_yday
+        
         # This is a simplified approximation for demo purposes
         # In a real astrology app, this would involve actual ephemeris calculations
         transits = [
             {
-                "description": f"木星在{self._get_transit_position(current_date, 'Jupiter')}",
+                "description": f"木星在{cls._get_transit_position(day_of_year, 'Jupiter')}",
                 "influence": "带来扩展和成长的机会"
             },
             {
-                "description": f"土星在{self._get_transit_position(current_date, 'Saturn')}",
+                "description": f"土星在{cls._get_transit_position(day_of_year, 'Saturn')}",
                 "influence": "提示你关注责任和结构"
             },
             {
-                "description": f"火星在{self._get_transit_position(current_date, 'Mars')}",
+                "description": f"火星在{cls._get_transit_position(day_of_year, 'Mars')}",
                 "influence": "影响你的动力和行动力"
             },
             {
-                "description": f"金星在{self._get_transit_position(current_date, 'Venus')}",
+                "description": f"金星在{cls._get_transit_position(day_of_year, 'Venus')}",
                 "influence": "影响你的关系和价值观"
             },
             {
-                "description": f"水星在{self._get_transit_position(current_date, 'Mercury')}",
+                "description": f"水星在{cls._get_transit_position(day_of_year, 'Mercury')}",
                 "influence": "影响你的沟通和思维方式"
             }
         ]
         
         # Add a special transit for the person's sun sign
-        month = current_date.month
-        day = current_date.day
-        for s in self.ZODIAC_SIGNS:
-            start_month, start_day = s["start_date"]
-            end_month, end_day = s["end_date"]
-            
-            if (month == start_month and day >= start_day) or \
-               (month == end_month and day <= end_day) or \
-               (start_month < month < end_month):
-                current_sign = s
-                break
-        else:
-            current_sign = self.ZODIAC_SIGNS[0]  # fallback
+        current_sign = (cls._SIGN_BY_MONTHDAY[current_date.month * 32 + current_date.day]
+                        or cls.ZODIAC_SIGNS[0])  # fallback
         
         transits.append({
             "description": f"太阳目前在{current_sign['name']}",
-            "influence": f"{'增强' if current_sign['element'] == sign['element'] else '挑战'}你的{sign['name']}能量"
+            "influence": f"{'增强' if current_sign['element'] == sign_element else '挑战'}你的{sign_name}能量"
         })
         
-        return transits
+        return tuple(MappingProxyType(transit) for transit in transits)
     
-    def _get_transit_position(self, date: datetime.date, planet: str) -> str:
+    @classmethod
+    @functools.lru_cache(maxsize=4096)
+    def _get_transit_position(cls, day_of_year: int, planet: str) -> str:
         """
-        Get a simplified transit position for a planet on a given date.
+        Get a simplified transit position for a planet on a given day of the year.
         This is a simplified version for demo purposes.
         
         Args:
-            date: Date for transit calculation
+            day_of_year: Day of the year (1-366) for transit calculation
             planet: Name of the planet
             
         Returns:
@@ -788,23 +978,12 @@ class ZodiacFortuneSystem(BaseFortuneSystem):
         """
         # This is a completely simplified approximation for demo purposes
         # In a real application, this would use proper ephemeris data
-        day_of_year = date.timetuple().tm_yday
-        
-        # Different "speeds" for different planets
-        if planet == "Moon":
-            # Moon moves fastest, about 13 degrees per day
-            sign_index = (day_of_year // 3) % 12
-        elif planet == "Mercury" or planet == "Venus":
-            # Mercury and Venus move relatively quickly
-            sign_index = ((day_of_year // 30) + (hash(planet) % 5)) % 12
-        elif planet == "Mars":
-            sign_index = ((day_of_year // 60) + 3) % 12
-        elif planet == "Jupiter":
-            sign_index = ((day_of_year // 365) + 7) % 12
-        elif planet == "Saturn":
-            sign_index = ((day_of_year // 730) + 10) % 12
-        else:
+        # Different "speeds" for different planets: (days per sign, offset)
+        params = _PLANET_PARAMS.get(planet)
+        if params is None:
             # Other planets or points
-            sign_index = ((day_of_year // 180) + hash(planet)) % 12
+            params = (180, hash(planet))
+        days_per_sign, offset = params
+        sign_index = ((day_of_year // days_per_sign) + offset) % 12
         
-        return self.ZODIAC_SIGNS[sign_index]["name"]
+        return cls.ZODIAC_SIGNS[sign_index]["name"]
@@ -68,15 +68,15 @@ class LLMTool(BaseTool):
         try:
             print(f"\n{Colors.CYAN}🔮 正在生成解读...{Colors.ENDC}\n")
             
-            full_response = ""
+            response_parts = []
             
             # 使用连接器的流式方法
             for chunk in self.llm_connector.generate_response_streaming(system_prompt, user_prompt):
-                full_response += chunk
+                response_parts.append(chunk)
                 print(chunk, end='', flush=True)
             
             print()  # 换行
-            return full_response
+            return "".join(response_parts)
             
         except Exception as e:
             self.logger.error(f"Streaming generation failed: {e}")
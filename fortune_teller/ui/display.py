@@ -11,10 +11,8 @@ from typing import Dict, Any, List, Generator
 from fortune_teller.ui.colors import Colors, ELEMENT_COLORS
 from fortune_teller.core import BaseFortuneSystem
 
-def print_welcome_screen():
-    """Display a welcome screen with ASCII art and information."""
-    # Chinese art title for 霄占
-    xiao_zhan_ascii = """
+# Chinese art title for 霄占
+_XIAO_ZHAN_ASCII = """
     ██╗  ██╗██╗ █████╗  ██████╗      ███████╗██╗  ██╗ █████╗ ███╗   ██╗
     ╚██╗██╔╝██║██╔══██╗██╔═══██╗     ╚══███╔╝██║  ██║██╔══██╗████╗  ██║
      ╚███╔╝ ██║███████║██║   ██║       ███╔╝ ███████║███████║██╔██╗ ██║
@@ -22,12 +20,43 @@ def print_welcome_screen():
     ██╔╝ ██╗██║██║  ██║╚██████╔╝     ███████╗██║  ██║██║  ██║██║ ╚████║
     ╚═╝  ╚═╝╚═╝╚═╝  ╚═╝ ╚═════╝      ╚══════╝╚═╝  ╚═╝╚═╝  ╚═╝╚═╝  ╚═══╝
     """
-    
-    print(f"{Colors.CYAN}{xiao_zhan_ascii}{Colors.ENDC}")
-    
-    print(f"{Colors.BOLD}欢迎使用 {Colors.YELLOW}霄占 (Fortune Teller){Colors.ENDC}{Colors.BOLD} 命理解析系统{Colors.ENDC}")
-    print(f"{Colors.CYAN}✨ 古今命理，尽在掌握 ✨{Colors.ENDC}")
-    print("\n" + "=" * 80 + "\n")
+
+# 欢迎界面内容固定，导入时拼装一次
+_WELCOME_SCREEN = (
+    f"{Colors.CYAN}{_XIAO_ZHAN_ASCII}{Colors.ENDC}\n"
+    f"{Colors.BOLD}欢迎使用 {Colors.YELLOW}霄占 (Fortune Teller){Colors.ENDC}{Colors.BOLD} 命理解析系统{Colors.ENDC}\n"
+    f"{Colors.CYAN}✨ 古今命理，尽在掌握 ✨{Colors.ENDC}\n"
+    "\n" + "=" * 80 + "\n\n"
+)
+
+
+_WELCOME_SCREEN_UTF8 = _WELCOME_SCREEN.encode("utf-8")
+
+
+# LLM 提供商显示信息：提供商 -> (显示名称, 固定模型名或 None, 带颜色的状态行)
+_STATUS_READY = f"{Colors.GREEN}✓ 大语言模型已连接，系统准备就绪{Colors.ENDC}"
+_STATUS_UNKNOWN = f"{Colors.YELLOW}? 未知状态{Colors.ENDC}"
+_PROVIDER_DISPLAY = {
+    "mock": ("模拟模式", "测试模型", f"{Colors.YELLOW}⚠️ 当前为测试模式，解读结果不具参考价值{Colors.ENDC}"),
+    "aws_bedrock": ("AWS Bedrock", None, _STATUS_READY),
+    "openai": ("OpenAI", None, _STATUS_READY),
+    "anthropic": ("Anthropic", None, _STATUS_READY),
+}
+_LLM_INFO_FOOTER = "\n" + "=" * 80
+
+
+def print_welcome_screen():
+    """Display a welcome screen with ASCII art and information."""
+    stdout = sys.stdout
+    buffer = getattr(stdout, "buffer", None)
+    encoding = (getattr(stdout, "encoding", None) or "").lower().replace("-", "")
+    if buffer is not None and encoding == "utf8":
+        # 预编码的字节直接写入底层缓冲区，跳过逐次编码
+        stdout.flush()
+        buffer.write(_WELCOME_SCREEN_UTF8)
+        buffer.flush()
+    else:
+        stdout.write(_WELCOME_SCREEN)
 
 
 def print_llm_info(config: Dict[str, Any]):
@@ -40,30 +69,18 @@ def print_llm_info(config: Dict[str, Any]):
     provider = config.get("provider", "未知")
     model = config.get("model", "未知")
     
-    if provider == "mock":
-        provider_name = "模拟模式"
-        model_name = "测试模型"
-        status = f"{Colors.YELLOW}⚠️ 当前为测试模式，解读结果不具参考价值{Colors.ENDC}"
-    elif provider == "aws_bedrock":
-        provider_name = "AWS Bedrock"
-        model_name = model
-        status = f"{Colors.GREEN}✓ 大语言模型已连接，系统准备就绪{Colors.ENDC}"
-    elif provider == "openai":
-        provider_name = "OpenAI"
-        model_name = model
-        status = f"{Colors.GREEN}✓ 大语言模型已连接，系统准备就绪{Colors.ENDC}"
-    elif provider == "anthropic":
-        provider_name = "Anthropic"
-        model_name = model
-        status = f"{Colors.GREEN}✓ 大语言模型已连接，系统准备就绪{Colors.ENDC}"
+    display = _PROVIDER_DISPLAY.get(provider)
+    if display is None:
+        provider_name, model_name, status = provider, model, _STATUS_UNKNOWN
     else:
-        provider_name = provider
-        model_name = model
-        status = f"{Colors.YELLOW}? 未知状态{Colors.ENDC}"
+        provider_name, model_name, status = display
+        model_name = model_name or model
     
-    print(f"🧠 当前使用的大语言模型: {Colors.GREEN}{provider_name} ({model_name}){Colors.ENDC}")
-    print(f"📡 连接状态: {status}")
-    print("\n" + "=" * 80)
+    sys.stdout.write(
+        f"🧠 当前使用的大语言模型: {Colors.GREEN}{provider_name} ({model_name}){Colors.ENDC}\n"
+        f"📡 连接状态: {status}\n"
+        f"{_LLM_INFO_FOOTER}\n"
+    )
 
 
 def print_available_systems(systems: List[Dict[str, Any]]) -> None:
@@ -269,7 +286,7 @@ def print_reading_result_streaming(
         chunk_logger.addHandler(chunk_handler)
     chunk_logger.info("=== START OF STREAMING SESSION ===")
 
-    complete_response = ""
+    response_parts = []
     chunk_count = 0
     header_printed = False
     json_start_pattern = re.compile(r'^\s*\{')
@@ -291,7 +308,7 @@ def print_reading_result_streaming(
             if chunk_count == 0 and start_time:
                 first_chunk_time = time.time()
                 latency = first_chunk_time - start_time
-                chunk_logger.info(f"⏱️ 首个块延迟: {latency:.3f}秒")
+                chunk_logger.info("⏱️ 首个块延迟: %.3f秒", latency)
 
             chunk_count += 1
 
@@ -301,22 +318,21 @@ def print_reading_result_streaming(
             # First real chunk — stop the spinner and print header.
             _finish_pending()
                 
-            # Log each chunk with details
-            chunk_repr = repr(chunk)
-            chunk_logger.info(f"Chunk #{chunk_count} received | Length: {len(chunk)} | Content: {chunk_repr}")
+            # Log each chunk with details (lazy formatting: repr is only built if emitted)
+            chunk_logger.info("Chunk #%d received | Length: %d | Content: %r", chunk_count, len(chunk), chunk)
             
             # Try to detect if we're receiving raw JSON and handle it appropriately
             if chunk_count <= 2 and json_start_pattern.match(chunk):
                 json_mode_detected = True
                 chunk_logger.warning("Detected JSON format in streaming output - will filter")
                 # Don't print raw JSON to console
-                complete_response += chunk
+                response_parts.append(chunk)
                 continue
                 
             # Skip chunks that look like JSON objects/fragments in JSON mode
             if json_mode_detected and (chunk.startswith('{') or chunk.startswith('"type":')):
-                chunk_logger.info(f"Skipping JSON fragment: {chunk[:30]}...")
-                complete_response += chunk
+                chunk_logger.info("Skipping JSON fragment: %.30s...", chunk)
+                response_parts.append(chunk)
                 continue
             
             # Strip any JSON formatting from text chunks
@@ -326,7 +342,7 @@ def print_reading_result_streaming(
             sys.stdout.write(clean_chunk)
             sys.stdout.flush()
 
-            complete_response += clean_chunk
+            response_parts.append(clean_chunk)
     except KeyboardInterrupt:
         _finish_pending()
         print(f"\n\n{Colors.RED}解读生成已被中断{Colors.ENDC}")
@@ -348,7 +364,7 @@ def print_reading_result_streaming(
     if output_path:
         print(f"{Colors.GREEN}✓ 结果已保存到:{Colors.ENDC} {output_path}")
     
-    return complete_response
+    return "".join(response_parts)
 
 
 def print_followup_result(topic: str, content: str):
@@ -387,7 +403,7 @@ def print_followup_result_streaming(
         chunk_logger.addHandler(chunk_handler)
     chunk_logger.info(f"=== START OF STREAMING SESSION FOR TOPIC: {topic} ===")
 
-    complete_response = ""
+    response_parts = []
     chunk_count = 0
     header_printed = False
 
@@ -407,11 +423,11 @@ def print_followup_result_streaming(
                 continue
 
             _finish_pending()
-            chunk_logger.info(f"Topic '{topic}' Chunk #{chunk_count} | Length: {len(chunk)} | Content: {chunk!r}")
+            chunk_logger.info("Topic '%s' Chunk #%d | Length: %d | Content: %r", topic, chunk_count, len(chunk), chunk)
 
             sys.stdout.write(chunk)
             sys.stdout.flush()
-            complete_response += chunk
+            response_parts.append(chunk)
     except KeyboardInterrupt:
         _finish_pending()
         print(f"\n\n{Colors.RED}解读生成已被中断{Colors.ENDC}")
@@ -423,7 +439,7 @@ def print_followup_result_streaming(
             pending_animation.stop()
 
     print(f"\n\n{Colors.CYAN}" + "-" * 40 + f"{Colors.ENDC}")
-    return complete_response
+    return "".join(response_parts)
 
 
 def display_topic_menu(valid_topics: List[str]) -> None:
@@ -117,8 +117,10 @@ def pick_from_list(
         print(f"{Colors.BOLD}{Colors.YELLOW}{title}{Colors.ENDC}")
     for i, option in enumerate(options, 1):
         print(f"  {i}. {option}")
+    prompt = f"请选择 (1-{len(options)}, q 退出): "
+    error = f"{Colors.RED}无效输入，请重试{Colors.ENDC}"
     while True:
-        raw = input(f"请选择 (1-{len(options)}, q 退出): ").strip().lower()
+        raw = input(prompt).strip().lower()
         if raw in ("q", "quit", ""):
             return None
         try:
@@ -127,7 +129,7 @@ def pick_from_list(
                 return idx
         except ValueError:
             pass
-        print(f"{Colors.RED}无效输入，请重试{Colors.ENDC}")
+        print(error)
 
 
 def select_language() -> Optional[str]:
@@ -1,6 +1,7 @@
 """
 Date and time utility functions for fortune telling applications.
 """
+import bisect
 import datetime
 import calendar
 from typing import Tuple, Optional, Union, Dict, Any
@@ -14,6 +15,18 @@ __all__ = [
     'format_date'
 ]
 
+# 星座起始日期（按日历顺序），编码为 month * 32 + day 以便二分查找
+_ZODIAC_STARTS = (
+    1 * 32 + 20, 2 * 32 + 19, 3 * 32 + 21, 4 * 32 + 20, 5 * 32 + 21, 6 * 32 + 21,
+    7 * 32 + 23, 8 * 32 + 23, 9 * 32 + 23, 10 * 32 + 23, 11 * 32 + 22, 12 * 32 + 22
+)
+_ZODIAC_NAMES = (
+    ("Aquarius", "水瓶座"), ("Pisces", "双鱼座"), ("Aries", "白羊座"),
+    ("Taurus", "金牛座"), ("Gemini", "双子座"), ("Cancer", "巨蟹座"),
+    ("Leo", "狮子座"), ("Virgo", "处女座"), ("Libra", "天秤座"),
+    ("Scorpio", "天蝎座"), ("Sagittarius", "射手座"), ("Capricorn", "摩羯座")
+)
+
 
 def lunar_to_solar(lunar_year: int, lunar_month: int, lunar_day: int,
                   is_leap_month: bool = False) -> Tuple[int, int, int]:
@@ -121,34 +134,15 @@ def get_zodiac_sign(month: int, day: int) -> Tuple[str, str]:
     Returns:
         Tuple of (zodiac_name_en, zodiac_name_zh)
     """
-    zodiac_signs = [
-        ((1, 20), (2, 18), "Aquarius", "水瓶座"),
-        ((2, 19), (3, 20), "Pisces", "双鱼座"),
-        ((3, 21), (4, 19), "Aries", "白羊座"),
-        ((4, 20), (5, 20), "Taurus", "金牛座"),
-        ((5, 21), (6, 20), "Gemini", "双子座"),
-        ((6, 21), (7, 22), "Cancer", "巨蟹座"),
-        ((7, 23), (8, 22), "Leo", "狮子座"),
-        ((8, 23), (9, 22), "Virgo", "处女座"),
-        ((9, 23), (10, 22), "Libra", "天秤座"),
-        ((10, 23), (11, 21), "Scorpio", "天蝎座"),
-        ((11, 22), (12, 21), "Sagittarius", "射手座"),
-        ((12, 22), (1, 19), "Capricorn", "摩羯座")
-    ]
-    
-    for (start_m, start_d), (end_m, end_d), name_en, name_zh in zodiac_signs:
-        # Handle special case of Capricorn (spans Dec-Jan)
-        if start_m == 12 and end_m == 1:
-            if (month == 12 and day >= start_d) or (month == 1 and day <= end_d):
-                return name_en, name_zh
-        else:
-            if (month == start_m and day >= start_d) or \
-               (month == end_m and day <= end_d) or \
-               (start_m < month < end_m):
-                return name_en, name_zh
-    
-    # Default fallback (should never reach here if data is correct)
-    return "Unknown", "未知"
+    if not 1 <= month <= 12:
+        return "Unknown", "未知"
+    
+    # Out-of-range days fall to the first/last sign of the month, as before
+    day = min(max(day, 0), 31)
+    
+    # Dates before the first start boundary (Jan 1-19) wrap to Capricorn
+    index = bisect.bisect_right(_ZODIAC_STARTS, month * 32 + day) - 1
+    return _ZODIAC_NAMES[index]
 
 
 def get_chinese_zodiac(year: int) -> str:
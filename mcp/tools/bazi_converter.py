@@ -15,6 +15,18 @@ HEAVENLY_STEMS = ["甲", "乙", "丙", "丁", "戊", "己", "庚", "辛", "壬",
 # 地支 (Earthly Branches)
 EARTHLY_BRANCHES = ["子", "丑", "寅", "卯", "辰", "巳", "午", "未", "申", "酉", "戌", "亥"]
 
+# 天干序号（替代 list.index 的线性查找）
+STEM_INDEX = {stem: index for index, stem in enumerate(HEAVENLY_STEMS)}
+
+# 月支固定：寅月(正月)、卯月(二月)...
+MONTH_BRANCHES = ("寅", "卯", "辰", "巳", "午", "未", "申", "酉", "戌", "亥", "子", "丑")
+
+# 月干起始表：甲己年丙作首，乙庚年戊为头...
+MONTH_STEM_START = (2, 4, 6, 8, 0, 2, 4, 6, 8, 0)
+
+# 时干起始表：甲己还加甲，乙庚丙作初...
+HOUR_STEM_START = (0, 2, 4, 6, 8, 0, 2, 4, 6, 8)
+
 # 五行 (Five Elements)
 FIVE_ELEMENTS = {
     "甲": "木", "乙": "木", "丙": "火", "丁": "火", "戊": "土", 
@@ -46,17 +58,11 @@ def get_stem_branch_from_year(year: int) -> Tuple[str, str]:
 
 def get_stem_branch_from_month(year: int, month: int) -> Tuple[str, str]:
     """Calculate stem and branch for month"""
-    # 月支固定：寅月(正月)、卯月(二月)...
-    month_branches = ["寅", "卯", "辰", "巳", "午", "未", "申", "酉", "戌", "亥", "子", "丑"]
-    branch = month_branches[month - 1]
-    
-    # 月干计算：甲己年丙作首，乙庚年戊为头...
-    year_stem = get_stem_branch_from_year(year)[0]
-    year_stem_index = HEAVENLY_STEMS.index(year_stem)
+    branch = MONTH_BRANCHES[month - 1]
     
-    # 月干起始表
-    month_stem_start = {0: 2, 1: 4, 2: 6, 3: 8, 4: 0, 5: 2, 6: 4, 7: 6, 8: 8, 9: 0}  # 甲年丙寅月开始
-    start_index = month_stem_start[year_stem_index]
+    # 月干计算：按年干查起始月干（甲年丙寅月开始）
+    year_stem_index = (year - 1984) % 10
+    start_index = MONTH_STEM_START[year_stem_index]
     stem_index = (start_index + month - 1) % 10
     
     return HEAVENLY_STEMS[stem_index], branch
@@ -84,15 +90,12 @@ def get_stem_branch_from_day(year: int, month: int, day: int) -> Tuple[str, str]
 
 def get_stem_branch_from_hour(hour: int, day_stem: str) -> Tuple[str, str]:
     """Calculate stem and branch for hour"""
-    # 时支固定
-    hour_branches = ["子", "丑", "寅", "卯", "辰", "巳", "午", "未", "申", "酉", "戌", "亥"]
+    # 时支固定（子时跨 23-1 点）
     branch_index = (hour + 1) // 2 % 12
-    branch = hour_branches[branch_index]
+    branch = EARTHLY_BRANCHES[branch_index]
     
-    # 时干计算：甲己还加甲，乙庚丙作初...
-    day_stem_index = HEAVENLY_STEMS.index(day_stem)
-    hour_stem_start = {0: 0, 1: 2, 2: 4, 3: 6, 4: 8, 5: 0, 6: 2, 7: 4, 8: 6, 9: 8}
-    start_index = hour_stem_start[day_stem_index]
+    # 时干计算：按日干查起始时干
+    start_index = HOUR_STEM_START[STEM_INDEX[day_stem]]
     stem_index = (start_index + branch_index) % 10
     
     return HEAVENLY_STEMS[stem_index], branch
@@ -36,3 +36,11 @@ def test_ui_imports():
     
     assert fortune_teller.ui is not None
     assert colors is not None
+
+def test_package_main_is_entry_point():
+    """The package-level `main` stays the CLI function, not the submodule."""
+    import fortune_teller.main
+    from fortune_teller import main
+
+    assert callable(main)
+    assert fortune_teller.main is main
@@ -0,0 +1,15 @@
+"""
+Tests for the date utility helpers.
+"""
+from fortune_teller.utils.date_utils import get_zodiac_sign
+
+
+def test_get_zodiac_sign_boundaries():
+    """Sign boundaries resolve correctly, including Capricorn's year wrap."""
+    assert get_zodiac_sign(1, 19) == ("Capricorn", "摩羯座")
+    assert get_zodiac_sign(1, 20) == ("Aquarius", "水瓶座")
+    assert get_zodiac_sign(3, 20) == ("Pisces", "双鱼座")
+    assert get_zodiac_sign(3, 21) == ("Aries", "白羊座")
+    assert get_zodiac_sign(12, 21) == ("Sagittarius", "射手座")
+    assert get_zodiac_sign(12, 22) == ("Capricorn", "摩羯座")
+    assert get_zodiac_sign(13, 1) == ("Unknown", "未知")
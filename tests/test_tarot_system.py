@@ -0,0 +1,71 @@
+"""
+Tests for the tarot fortune system plugin.
+"""
+from fortune_teller.plugins.tarot.fortune_system import TarotFortuneSystem
+
+
+def test_deck_shared_across_instances():
+    """Instances with the same data directory share one immutable deck."""
+    first = TarotFortuneSystem()
+    second = TarotFortuneSystem()
+
+    assert isinstance(first.cards, tuple)
+    assert first.cards is second.cards
+    assert len(first.cards) > 0
+
+
+def test_draw_cards_unique():
+    """Drawn cards never repeat and are capped at the deck size."""
+    system = TarotFortuneSystem()
+
+    drawn = system._draw_cards(10)
+    assert len({card.name for card in drawn}) == 10
+
+    assert len(system._draw_cards(1000)) == len(system.cards)
+
+
+def test_seeded_rng_is_reproducible():
+    """Readings are reproducible when a seeded generator is injected."""
+    import random
+
+    user_input = {"question": "今年的事业如何？", "spread": "three_card", "focus_area": "事业"}
+    readings = []
+    for _ in range(2):
+        system = TarotFortuneSystem(rng=random.Random(42))
+        validated = system.validate_input(user_input)
+        readings.append(system.process_data(validated)["reading"])
+
+    assert readings[0] == readings[1]
+
+
+def test_format_result_sections():
+    """Markdown and bracket headers split the response into sections."""
+    system = TarotFortuneSystem()
+    response = "## 各牌位解读\n过去：皇帝\n\n【整体分析】\n综合来看一切顺利\n## 建议\n保持耐心"
+
+    result = system.format_result(response)
+
+    assert result["reading"] == {
+        "各牌位详细解读": "过去：皇帝",
+        "整体解读": "【整体分析】\n综合来看一切顺利",
+        "建议": "保持耐心",
+    }
+    assert result["full_text"] == response
+
+
+def test_format_result_without_sections():
+    """A response without headers becomes a single overall section."""
+    system = TarotFortuneSystem()
+
+    result = system.format_result("  只有一段解读  \n")
+
+    assert result["reading"] == {"整体解读": "只有一段解读"}
+
+
+def test_format_result_duplicate_normalized_titles():
+    """Headings normalizing to one title keep the last distinct heading's body."""
+    system = TarotFortuneSystem()
+
+    result = system.format_result("【综合】 x\n## 整体\n  \n【综合】 x")
+
+    assert result["reading"] == {"整体解读": ""}
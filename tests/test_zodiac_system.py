@@ -0,0 +1,135 @@
+"""
+Tests for the zodiac fortune system plugin.
+"""
+import datetime
+
+from fortune_teller.plugins.zodiac.fortune_system import ZodiacFortuneSystem
+
+
+def test_zodiac_sign_boundaries():
+    """Sign lookup handles range boundaries, including Capricorn's year wrap."""
+    system = ZodiacFortuneSystem()
+
+    assert system._get_zodiac_sign(3, 21)["english"] == "Aries"
+    assert system._get_zodiac_sign(3, 20)["english"] == "Pisces"
+    assert system._get_zodiac_sign(12, 22)["english"] == "Capricorn"
+    assert system._get_zodiac_sign(1, 19)["english"] == "Capricorn"
+    assert system._get_zodiac_sign(1, 20)["english"] == "Aquarius"
+    assert system._get_zodiac_sign(2, 29)["english"] == "Pisces"
+
+
+def test_zodiac_sign_every_day_of_year():
+    """Every calendar day maps to the sign whose date range contains it."""
+    system = ZodiacFortuneSystem()
+    day = datetime.date(2024, 1, 1)
+
+    while day.year == 2024:
+        sign = system._get_zodiac_sign(day.month, day.day)
+        start = datetime.date(2024, *sign["start_date"])
+        end = datetime.date(2024, *sign["end_date"])
+        if start <= end:
+            assert start <= day <= end
+        else:
+            assert day >= start or day <= end
+        day += datetime.timedelta(days=1)
+
+
+def test_sign_compatibility():
+    """Compatibility follows the element relationships of the signs."""
+    system = ZodiacFortuneSystem()
+    aries = system._get_zodiac_sign(4, 1)
+
+    compatibility = system._get_sign_compatibility(aries)
+
+    assert len(compatibility) == 12
+    assert compatibility["白羊座"] == "自己"
+    assert compatibility["狮子座"] == "非常好"   # fire
+    assert compatibility["双子座"] == "好"       # air
+    assert compatibility["巨蟹座"] == "需要努力"  # water
+    assert compatibility["金牛座"] == "一般"     # earth
+
+
+def test_format_result_sections():
+    """Markdown headers split the response into sections."""
+    system = ZodiacFortuneSystem()
+    response = "开场白\n## 性格分析\n热情\n\n# 事业\n稳步上升\n## 空标题"
+
+    result = system.format_result(response)
+
+    assert result["reading"] == {
+        "总体解读": "开场白",
+        "性格分析": "热情",
+        "事业": "稳步上升",
+    }
+    assert result["full_text"] == response
+
+
+def test_instance_has_no_dict():
+    """The zodiac system keeps only the base attributes, in slots."""
+    system = ZodiacFortuneSystem()
+
+    assert not hasattr(system, "__dict__")
+    assert system.name == "zodiac"
+
+
+def test_instance_is_weak_referenceable():
+    """Slotted plugins still support weak references and are not kept alive by caches."""
+    import gc
+    import weakref
+
+    system = ZodiacFortuneSystem()
+    system._get_current_transits(system._get_zodiac_sign(4, 1), datetime.date(2024, 6, 1))
+    ref = weakref.ref(system)
+
+    del system
+    gc.collect()
+
+    assert ref() is None
+
+
+def test_current_transits_cached_copies():
+    """Transits are computed once per sign and day but returned as fresh dicts."""
+    system = ZodiacFortuneSystem()
+    aries = system._get_zodiac_sign(4, 1)
+    today = datetime.date(2024, 6, 1)
+
+    first = system._get_current_transits(aries, today)
+    first[0]["description"] = "changed"
+    second = system._get_current_transits(aries, today)
+
+    assert second[0]["description"] != "changed"
+    assert second[-1]["description"] == "太阳目前在双子座"
+
+
+def test_transits_cache_shared_across_instances():
+    """The transit cache is keyed on sign and day, not on the instance."""
+    ZodiacFortuneSystem._cached_transits.cache_clear()
+    aries = ZodiacFortuneSystem()._get_zodiac_sign(4, 1)
+    today = datetime.date(2024, 6, 1)
+
+    systems = [ZodiacFortuneSystem() for _ in range(5)]
+    for system in systems:
+        system._get_current_transits(aries, today)
+    info = ZodiacFortuneSystem._cached_transits.cache_info()
+    assert (info.hits, info.misses) == (4, 1)
+
+
+def test_display_uses_given_element_info(capsys):
+    """The element section renders the caller's element_info, not the class table."""
+    system = ZodiacFortuneSystem()
+    processed = system.process_data(system.validate_input({
+        "birth_date": "1990-08-01",
+        "birth_time": "10:00",
+        "birth_place": "北京",
+        "question_area": "事业",
+    }))
+    processed["element_info"] = {"keywords": ["自定义"]}
+
+    system.display_processed_data(processed)
+    out = capsys.readouterr().out
+
+    assert "【火🔥 元素特性】" in out
+    assert "自定义" in out
+    assert "激情" not in out
+    assert "相容元素" not in out
+    assert "冲突元素" not in out